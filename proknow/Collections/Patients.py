@@ -23,13 +23,15 @@ class CollectionPatients(object):
         self._requestor = self._collection._requestor
 
     def _query(self, query):
-        res, data = self._requestor.get('/collections/' + self._collection.id + '/patients', params=query)
-        if res.headers['proknow-has-more'] == 'true': # pragma: no cover (difficult to test w/o lg num of patients)
-            next_query = dict(query)
-            next_query["next"] = res.headers['proknow-next']
-            return data + self._query(next_query)
-        else:
-            return data
+        patients = []
+        while True:
+            res, data = self._requestor.get('/collections/' + self._collection.id + '/patients', params=query)
+            patients.extend(data)
+            if res.headers['proknow-has-more'] == 'true': # pragma: no cover (difficult to test w/o lg num of patients)
+                query = dict(query)
+                query["next"] = res.headers['proknow-next']
+            else:
+                return patients
 
     def add(self, workspace, items):
         """Add patients (with optional representative entities) within a workspace to the collection.
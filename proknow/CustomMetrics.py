@@ -5,6 +5,7 @@ __all__ = [
 import re
 
 from .Exceptions import CustomMetricLookupError
+from .Utils import index_by_id_and_name
 
 
 class CustomMetrics(object):
@@ -26,6 +27,14 @@ class CustomMetrics(object):
         self._proknow = proknow
         self._requestor = requestor
         self._cache = None
+        self._index = None
+
+    def _get_index(self):
+        if self._cache is None:
+            self.query()
+        if self._index is None:
+            self._index = index_by_id_and_name(self._cache)
+        return self._index
 
     def create(self, name, context, type):
         """Creates a new custom metric.
@@ -68,6 +77,7 @@ class CustomMetrics(object):
 
         _, custom_metric = self._requestor.post('/metrics/custom', json={'name': name, 'context': context, 'type': type})
         self._cache = None
+        self._index = None
         return CustomMetricItem(self, custom_metric)
 
     def delete(self, custom_metric_id):
@@ -92,6 +102,7 @@ class CustomMetrics(object):
         assert isinstance(custom_metric_id, str), "`custom_metric_id` is required as a string."
         self._requestor.delete('/metrics/custom/' + custom_metric_id)
         self._cache = None
+        self._index = None
 
     def find(self, predicate=None, **props):
         """Finds the first custom metric that matches the input paramters.
@@ -180,15 +191,8 @@ class CustomMetrics(object):
         """
         assert isinstance(name, str), "`name` is required as a string."
 
-        if self._cache is None:
-            self.query()
-        normalized = name.lower()
-        for metric in self._cache:
-            if metric.name.lower() == normalized:
-                custom_metric = metric
-                break
-        else:
-            custom_metric = None
+        _, by_name = self._get_index()
+        custom_metric = by_name.get(name.lower())
         if custom_metric is None:
             raise CustomMetricLookupError("Custom metric with name `" + name + "` not found.")
         return custom_metric
@@ -211,7 +215,8 @@ class CustomMetrics(object):
         """
         assert isinstance(custom_metric_id, str), "`custom_metric_id` is required as a string."
 
-        custom_metric = self.find(id=custom_metric_id)
+        by_id, _ = self._get_index()
+        custom_metric = by_id.get(custom_metric_id)
         if custom_metric is None:
             raise CustomMetricLookupError("Custom metric with id `" + custom_metric_id + "` not found.")
         return custom_metric
@@ -238,8 +243,9 @@ class CustomMetrics(object):
                 for custom_metric in pk.custom_metrics.query():
                     print(custom_metric.name)
         """
-        _, custom_metrics = self._requestor.get('/metrics/custom')
+        _, custom_metrics = self._requestor.get_revalidated('/metrics/custom')
         self._cache = [CustomMetricItem(self, custom_metric) for custom_metric in custom_metrics]
+        self._index = None
         return self._cache
 
 class CustomMetricItem(object):
@@ -308,6 +314,13 @@ class CustomMetricItem(object):
     def save(self):
         """Saves the changes made to a custom metric.
 
+        Note:
+            If neither the name nor the context has changed since the custom metric was last
+            retrieved or saved, no request is made. This is a change from earlier versions, which
+            always sent the update: saving an unchanged custom metric that has since been deleted
+            no longer raises an :class:`proknow.Exceptions.HttpError`, and :attr:`data` is not
+            refreshed from the server.
+
         Raises:
             :class:`proknow.Exceptions.HttpError`: If the HTTP request generated an error.
 
@@ -322,7 +335,10 @@ class CustomMetricItem(object):
                 metric.name = "Genetic Type"
                 metric.save()
         """
+        if self.name == self._data["name"] and self.context == self._data["context"]:
+            return
         _, custom_metric = self._requestor.put('/metrics/custom/' + self._id, json={'name': self.name, 'context': self.context})
+        self._custom_metrics._index = None
         self._data = custom_metric
         self.name = custom_metric["name"]
         self.context = custom_metric["context"]
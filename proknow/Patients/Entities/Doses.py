@@ -52,10 +52,12 @@ class DoseItem(EntityItem):
         """Downloads the dose file.
 
         Parameters:
-            path (str): A path to a directory or file to which the dose file should be streamed.
+            path (str or file): A path to a directory or file, or a writable binary file object, to
+                which the dose file should be streamed.
 
         Returns:
-            str: The absolute path to the downloaded file.
+            str or file: The absolute path to the downloaded file or, if a file object was
+            provided, the file object.
 
         Raises:
             AssertionError: If the input parameters are invalid.
@@ -74,16 +76,19 @@ class DoseItem(EntityItem):
                 dose = entities[0].get()
                 dose.download("./")
         """
-        assert isinstance(path, str), "`path` is required as a string."
-        if os.path.isdir(path):
-            resolved_path = os.path.join(os.path.abspath(path), "RD." + self._data["uid"] + ".dcm")
-        else:
-            absolute = os.path.abspath(path)
-            directory = os.path.dirname(path)
-            if os.path.isdir(directory):
-                resolved_path = absolute
+        if isinstance(path, str):
+            if os.path.isdir(path):
+                resolved_path = os.path.join(os.path.abspath(path), "RD." + self._data["uid"] + ".dcm")
             else:
-                raise InvalidPathError('`' + path + '` is invalid')
+                absolute = os.path.abspath(path)
+                directory = os.path.dirname(path)
+                if os.path.isdir(directory):
+                    resolved_path = absolute
+                else:
+                    raise InvalidPathError('`' + path + '` is invalid')
+        else:
+            assert hasattr(path, "write"), "`path` is required as a string or a writable file object."
+            resolved_path = path
 
         self._requestor.stream('/workspaces/' + self._workspace_id + '/doses/' + self._id + '/dicom', resolved_path)
         return resolved_path
@@ -71,7 +71,7 @@ class EntityItem(object):
                 pk = ProKnow('https://example.proknow.com', credentials_file="./credentials.json")
                 patients = pk.patients.lookup("Clinical", ["HNC-0522c0009"])
                 patient = patients[0].get()
-                entities = patient.find_entities(lambda entity: True)
+                entities = patient.list_entities()
                 for entity in entities:
                     entity.get().delete()
         """
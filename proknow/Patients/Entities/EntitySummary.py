@@ -66,7 +66,7 @@ class EntitySummary(object):
                 pk = ProKnow('https://example.proknow.com', credentials_file="./credentials.json")
                 patients = pk.patients.lookup("Clinical", ["HNC-0522c0009"])
                 patient = patients[0].get()
-                entities = [entity.get() for entity in patient.find_entities(lambda entity: True)]
+                entities = [entity.get() for entity in patient.list_entities()]
         """
         entity_type = self._data["type"]
         count = 0
@@ -139,7 +139,7 @@ class EntitySummary(object):
                 pk = ProKnow('https://example.proknow.com', credentials_file="./credentials.json")
                 patients = pk.patients.lookup("Clinical", ["HNC-0522c0009"])
                 patient = patients[0].get()
-                entities = patient.find_entities(lambda entity: True)
+                entities = patient.list_entities()
                 for entity in entities:
                     entity.delete()
         """
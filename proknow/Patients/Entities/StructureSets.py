@@ -1,7 +1,7 @@
 import os
 from time import sleep
 from datetime import datetime, timedelta
-from threading import Timer
+from threading import Event, Timer
 
 from .EntityItem import EntityItem
 from ...Exceptions import InvalidOperationError, InvalidPathError, TimeoutExceededError, HttpError
@@ -12,6 +12,9 @@ class StructureSetDraftLockRenewer(object):
 
     This class is responsible for keeping the structure set lock from expiring.
 
+    Attributes:
+        renewed (threading.Event): An event that is set each time the lock is renewed.
+
     """
 
     def __init__(self, structure_set):
@@ -30,6 +33,7 @@ class StructureSetDraftLockRenewer(object):
         self._requestor = structure_set._requestor
         self._timer = None
         self._started = False
+        self.renewed = Event()
 
     def _run(self):
         """A helper function used to perform the lock renewal"""
@@ -38,6 +42,7 @@ class StructureSetDraftLockRenewer(object):
         lid = self._structure_set._lock["id"]
         _, lock = self._requestor.put('/workspaces/' + wid + '/structuresets/' + sid + '/draft/lock/' + lid)
         self._structure_set._lock = lock
+        self.renewed.set()
 
     def start(self):
         """Starts the lock renewal timer in the background."""
@@ -255,11 +260,12 @@ class StructureSetItem(EntityItem):
         """Download the current structure set file.
 
         Parameters:
-            path (str): A path to a directory or file to which the structure set file should be
-                streamed.
+            path (str or file): A path to a directory or file, or a writable binary file object, to
+                which the structure set file should be streamed.
 
         Returns:
-            str: The absolute path to the downloaded file.
+            str or file: The absolute path to the downloaded file or, if a file object was
+            provided, the file object.
 
         Raises:
             AssertionError: If the input parameters are invalid.
@@ -282,16 +288,19 @@ class StructureSetItem(EntityItem):
         """
         if self._is_draft:
             raise InvalidOperationError('Draft versions of structure sets cannot be downloaded')
-        assert isinstance(path, str), "`path` is required as a string."
-        if os.path.isdir(path):
-            resolved_path = os.path.join(os.path.abspath(path), "RS." + self._data["uid"] + ".dcm")
-        else:
-            absolute = os.path.abspath(path)
-            directory = os.path.dirname(path)
-            if os.path.isdir(directory):
-                resolved_path = absolute
+        if isinstance(path, str):
+            if os.path.isdir(path):
+                resolved_path = os.path.join(os.path.abspath(path), "RS." + self._data["uid"] + ".dcm")
             else:
-                raise InvalidPathError('`' + path + '` is invalid')
+                absolute = os.path.abspath(path)
+                directory = os.path.dirname(path)
+                if os.path.isdir(directory):
+                    resolved_path = absolute
+                else:
+                    raise InvalidPathError('`' + path + '` is invalid')
+        else:
+            assert hasattr(path, "write"), "`path` is required as a string or a writable file object."
+            resolved_path = path
         wid = self._workspace_id
         sid = self._id
         self._requestor.stream('/workspaces/' + wid + '/structuresets/' + sid + '/versions/' + self._data["data"]["version"] + '/dicom', resolved_path)
@@ -880,11 +889,12 @@ class StructureSetVersionItem(object):
         """Download the version of the structure set.
 
         Parameters:
-            path (str): A path to a directory or file to which the structure set file should be
-                streamed.
+            path (str or file): A path to a directory or file, or a writable binary file object, to
+                which the structure set file should be streamed.
 
         Returns:
-            str: The absolute path to the downloaded file.
+            str or file: The absolute path to the downloaded file or, if a file object was
+            provided, the file object.
 
         Raises:
             AssertionError: If the input parameters are invalid.
@@ -910,16 +920,19 @@ class StructureSetVersionItem(object):
         if self._is_draft:
             raise InvalidOperationError('Draft versions of structure sets cannot be downloaded')
 
-        assert isinstance(path, str), "`path` is required as a string."
-        if os.path.isdir(path):
-            resolved_path = os.path.join(os.path.abspath(path), "RS." + self._version_id + ".dcm")
-        else:
-            absolute = os.path.abspath(path)
-            directory = os.path.dirname(path)
-            if os.path.isdir(directory):
-                resolved_path = absolute
+        if isinstance(path, str):
+            if os.path.isdir(path):
+                resolved_path = os.path.join(os.path.abspath(path), "RS." + self._version_id + ".dcm")
             else:
-                raise InvalidPathError('`' + path + '` is invalid')
+                absolute = os.path.abspath(path)
+                directory = os.path.dirname(path)
+                if os.path.isdir(directory):
+                    resolved_path = absolute
+                else:
+                    raise InvalidPathError('`' + path + '` is invalid')
+        else:
+            assert hasattr(path, "write"), "`path` is required as a string or a writable file object."
+            resolved_path = path
 
         # Wait for version to be generated
         self._wait()
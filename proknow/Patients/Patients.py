@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from .Scorecards import PatientScorecards
@@ -25,14 +26,31 @@ class Patients(object):
         self._requestor = requestor
 
     def _query(self, workspace, query):
-        res, data = self._requestor.get('/workspaces/' + workspace.id + '/patients', params=query)
-        if res.headers['proknow-has-more'] == 'true': # pragma: no cover (difficult to test w/o lg num of patients)
-            next_query = dict(query)
-            next_query['page_epoch'] = res.headers['proknow-epoch']
-            next_query["page_number"] = res.headers['proknow-next-page']
-            return data + self._query(workspace, next_query)
-        else:
-            return data
+        # Each page names the next one, so pages are fetched in turn and collected into one list
+        patients = []
+        while True:
+            res, data = self._requestor.get('/workspaces/' + workspace.id + '/patients', params=query)
+            patients.extend(data)
+            if res.headers['proknow-has-more'] == 'true': # pragma: no cover (difficult to test w/o lg num of patients)
+                query = dict(query)
+                query['page_epoch'] = res.headers['proknow-epoch']
+                query["page_number"] = res.headers['proknow-next-page']
+            else:
+                return patients
+
+    def _create_body(self, mrn, name, birth_date=None, sex=None):
+        assert isinstance(mrn, str), "`mrn` is required as a string."
+        assert isinstance(name, str), "`name` is required as a string."
+        if birth_date is not None:
+            assert isinstance(birth_date, str), "`birth_date` is required as a string."
+        if sex is not None:
+            assert isinstance(sex, str), "`sex` is required as a string."
+        return {
+            "mrn": mrn,
+            "name": name,
+            "birth_date": birth_date,
+            "sex": sex,
+        }
 
     def create(self, workspace, mrn, name, birth_date=None, sex=None):
         """Creates a new patient.
@@ -64,25 +82,67 @@ class Patients(object):
                 patient = pk.patients.create("Clinical", "12345", "Becker^Matthew")
         """
         assert isinstance(workspace, str), "`workspace` is required as a string."
-        assert isinstance(mrn, str), "`mrn` is required as a string."
-        assert isinstance(name, str), "`name` is required as a string."
-        if birth_date is not None:
-            assert isinstance(birth_date, str), "`birth_date` is required as a string."
-        if sex is not None:
-            assert isinstance(sex, str), "`sex` is required as a string."
+        body = self._create_body(mrn, name, birth_date, sex)
 
         item = self._proknow.workspaces.resolve(workspace)
 
-        body = {
-            "mrn": mrn,
-            "name": name,
-            "birth_date": birth_date,
-            "sex": sex,
-        }
-
         _, patient = self._requestor.post('/workspaces/' + item.id + '/patients', json=body)
         return PatientItem(self, item.id, patient)
 
+    def create_many(self, workspace, patients, max_workers=8):
+        """Creates several new patients concurrently.
+
+        The workspace is resolved once and the patients are then created in parallel, so the
+        total time is close to that of the slowest request rather than the sum of all of them.
+
+        Note:
+            The creates are independent of one another. If any of them fails, the
+            :class:`proknow.Exceptions.HttpError` is raised only after the remaining creates have
+            finished, and any patients that were created are neither returned nor rolled back.
+
+        Parameters:
+            workspace (str): An id or name of the workspace in which to create the patients.
+            patients (list): A list of dictionaries, each with the keys ``"mrn"`` and ``"name"``
+                and, optionally, ``"birth_date"`` and ``"sex"`` (see :meth:`create`).
+            max_workers (int, optional): The maximum number of concurrent create requests.
+
+        Returns:
+            list: A list of :class:`proknow.Patients.PatientItem` objects in the same order as the
+            input list.
+
+        Raises:
+            AssertionError: If the input parameters are invalid.
+            :class:`proknow.Exceptions.HttpError`: If the HTTP request generated an error.
+            :class:`proknow.Exceptions.WorkspaceLookupError`: If the workspace with the given
+                name or id could not be found.
+
+        Example:
+            This example shows how to create two patients in the workspace called "Clinical"::
+
+                from proknow import ProKnow
+
+                pk = ProKnow('https://example.proknow.com', credentials_file="./credentials.json")
+                patients = pk.patients.create_many("Clinical", [
+                    {"mrn": "12345", "name": "Becker^Matthew"},
+                    {"mrn": "67890", "name": "Becker^Sarah", "sex": "F"},
+                ])
+        """
+        assert isinstance(workspace, str), "`workspace` is required as a string."
+        assert isinstance(patients, list), "`patients` is required as a list."
+        bodies = []
+        for patient in patients:
+            assert isinstance(patient, dict), "`patients` is required as a list of dictionaries."
+            bodies.append(self._create_body(patient.get("mrn"), patient.get("name"), patient.get("birth_date"), patient.get("sex")))
+
+        item = self._proknow.workspaces.resolve(workspace)
+
+        def _create(body):
+            _, data = self._requestor.post('/workspaces/' + item.id + '/patients', json=body)
+            return PatientItem(self, item.id, data)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_create, bodies))
+
     def delete(self, workspace_id, patient_id):
         """Deletes a patient.
 
@@ -410,6 +470,8 @@ class PatientItem(object):
         self.scorecards = PatientScorecards(self._patients, self._workspace_id, self._id)
         self.studies = [StudySummary(self._patients, self._workspace_id, self._id, study) for study in patient["studies"]]
         self.tasks = Tasks(self._patients, self._workspace_id, self._id)
+        self._entity_index = None
+        self._entity_index_studies = None
 
     @property
     def id(self):
@@ -554,6 +616,23 @@ class PatientItem(object):
         self.metadata = patient["metadata"]
         self.studies = [StudySummary(self._patients, self._workspace_id, self._id, study) for study in patient["studies"]]
 
+    def _index_entities(self):
+        # The flattened entity list and its index by type are rebuilt only when ``studies`` has
+        # been replaced (i.e., by ``refresh`` or ``save``)
+        if self._entity_index_studies is not self.studies:
+            entities = []
+            entities_by_type = {}
+            for study in self.studies:
+                stack = list(reversed(study.entities))
+                while len(stack) > 0:
+                    entity = stack.pop()
+                    entities.append(entity)
+                    entities_by_type.setdefault(entity.data["type"], []).append(entity)
+                    stack.extend(reversed(entity.entities))
+            self._entity_index = (entities, entities_by_type)
+            self._entity_index_studies = self.studies
+        return self._entity_index
+
     def find_entities(self, predicate=None, **props):
         """Finds the entities for the patient matching the input paramters.
 
@@ -593,48 +672,42 @@ class PatientItem(object):
         if predicate is None and len(props) == 0:
             return []
 
-        entities = []
-        for study in self.studies:
-            for entity_i in study.entities:
-                match_i = True
-                for key in props:
-                    if entity_i.data[key] != props[key]:
-                        match_i = False
-                if predicate is not None and not predicate(entity_i):
-                    match_i = False
-                if match_i:
-                    entities.append(entity_i)
-
-                for entity_j in entity_i.entities:
-                    match_j = True
-                    for key in props:
-                        if entity_j.data[key] != props[key]:
-                            match_j = False
-                    if predicate is not None and not predicate(entity_j):
-                        match_j = False
-                    if match_j:
-                        entities.append(entity_j)
-
-                    for entity_k in entity_j.entities:
-                        match_k = True
-                        for key in props:
-                            if entity_k.data[key] != props[key]:
-                                match_k = False
-                        if predicate is not None and not predicate(entity_k):
-                            match_k = False
-                        if match_k:
-                            entities.append(entity_k)
-
-                        for entity_m in entity_k.entities:
-                            match_m = True
-                            for key in props:
-                                if entity_m.data[key] != props[key]:
-                                    match_m = False
-                            if predicate is not None and not predicate(entity_m):
-                                match_m = False
-                            if match_m:
-                                entities.append(entity_m)
-        return entities
+        entities, entities_by_type = self._index_entities()
+        if "type" in props:
+            entities = entities_by_type.get(props["type"], [])
+
+        matches = []
+        for entity in entities:
+            match = True
+            for key in props:
+                if entity.data[key] != props[key]:
+                    match = False
+            if predicate is not None and not predicate(entity):
+                match = False
+            if match:
+                matches.append(entity)
+        return matches
+
+    def list_entities(self):
+        """Lists all of the entities for the patient.
+
+        Returns:
+            list: A flattened list of all :class:`proknow.Patients.EntitySummary` objects for the
+            patient, in the same order as returned by :meth:`find_entities`.
+
+        Example:
+            Use this example to print the description of every entity for a patient::
+
+                from proknow import ProKnow
+
+                pk = ProKnow('https://example.proknow.com', credentials_file="./credentials.json")
+                patients = pk.patients.lookup("Clinical", ["HNC-0522c0009"])
+                patient = patients[0].get()
+                for entity in patient.list_entities():
+                    print(entity.data["description"])
+        """
+        entities, _ = self._index_entities()
+        return list(entities)
 
     def get_metadata(self):
         """Gets the metadata dictionary and decodes the ids into metrics names.
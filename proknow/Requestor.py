@@ -2,8 +2,11 @@ __all__ = [
     'Requestor',
 ]
 
+import copy
+import shutil
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .Exceptions import HttpError
 
@@ -11,7 +14,7 @@ from .Exceptions import HttpError
 class Requestor(object):
     """A class used for issuing requests for the ProKnow API"""
 
-    def __init__(self, base_url, username, password, max_retries=3):
+    def __init__(self, base_url, username, password, max_retries=3, pool_maxsize=16):
         """Initializes the Requestor class.
 
         Parameters:
@@ -19,13 +22,18 @@ class Requestor(object):
             username (str): The string used in Basic Authentication as the user name.
             password (str): The string used in Basic Authentication as the user password.
             max_retries (int, optional): The maximum number of for failed connection attempts.
+            pool_maxsize (int, optional): The maximum number of keep-alive connections to hold
+                open per host. Connections are reused across requests to avoid repeating the
+                TCP/TLS handshake.
         """
-        self._username = username
-        self._password = password
         self._base_url = base_url + "/api"
         self._session = requests.Session()
-        self._session.mount('http', HTTPAdapter(max_retries=max_retries))
-        self._session.mount('https', HTTPAdapter(max_retries=max_retries))
+        self._session.auth = (username, password)
+        retry = Retry(total=max_retries, backoff_factor=0.2)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry)
+        self._session.mount('http', adapter)
+        self._session.mount('https', adapter)
+        self._revalidated = {}
 
     def _handle_response(self, r, binary=False):
         if r.status_code >= 400:
@@ -52,9 +60,36 @@ class Requestor(object):
             2. msg (str, dict): the text response or, if the response was JSON, the decoded JSON
                dictionary.
         """
-        r = self._session.get(self._base_url + route, auth=(self._username, self._password), **kwargs)
+        r = self._session.get(self._base_url + route, **kwargs)
         return self._handle_response(r)
 
+    def get_revalidated(self, route):
+        """Issues an HTTP ``GET`` request, revalidating the last response for the route.
+
+        The ``ETag`` of the last response for the route is sent as ``If-None-Match``. If the server
+        answers ``304 Not Modified``, the payload stored with that ``ETag`` is returned instead.
+
+        Parameters:
+            route (str): The API route to use in the request.
+
+        Returns:
+            tuple: A tuple (res, msg).
+
+            1. res (Response): the Response object
+            2. msg (str, dict): the text response or, if the response was JSON, the decoded JSON
+               dictionary. It is a copy, so the caller may modify it freely.
+        """
+        # The (etag, payload) pair is read once and replaced as a whole, so concurrent requests
+        # never pair an ETag with another response's payload
+        etag, payload = self._revalidated.get(route, (None, None))
+        headers = {} if etag is None else {"If-None-Match": etag}
+        res, msg = self.get(route, headers=headers)
+        if res.status_code == 304:
+            return (res, copy.deepcopy(payload))
+        if "ETag" in res.headers:
+            self._revalidated[route] = (res.headers["ETag"], copy.deepcopy(msg))
+        return (res, msg)
+
     def get_binary(self, route, **kwargs):
         """Issues an HTTP ``GET`` request, returning the binary data.
 
@@ -72,7 +107,7 @@ class Requestor(object):
             1. res (Response): the Response object
             2. data (bytes): The resonse as a byte string
         """
-        r = self._session.get(self._base_url + route, auth=(self._username, self._password), **kwargs)
+        r = self._session.get(self._base_url + route, **kwargs)
         return self._handle_response(r, True)
 
     def delete(self, route, **kwargs):
@@ -90,7 +125,7 @@ class Requestor(object):
             2. msg (str, dict): the text response or, if the response was JSON, the decoded JSON
                dictionary.
         """
-        r = self._session.delete(self._base_url + route, auth=(self._username, self._password), **kwargs)
+        r = self._session.delete(self._base_url + route, **kwargs)
         return self._handle_response(r)
 
     def patch(self, route, **kwargs): # pragma: no cover (not used right now)
@@ -108,7 +143,7 @@ class Requestor(object):
             2. msg (str, dict): the text response or, if the response was JSON, the decoded JSON
                dictionary.
         """
-        r = self._session.patch(self._base_url + route, auth=(self._username, self._password), **kwargs)
+        r = self._session.patch(self._base_url + route, **kwargs)
         return self._handle_response(r)
 
     def post(self, route, **kwargs):
@@ -126,7 +161,7 @@ class Requestor(object):
             2. msg (str, dict): the text response or, if the response was JSON, the decoded JSON
                dictionary.
         """
-        r = self._session.post(self._base_url + route, auth=(self._username, self._password), **kwargs)
+        r = self._session.post(self._base_url + route, **kwargs)
         return self._handle_response(r)
 
     def put(self, route, **kwargs):
@@ -144,22 +179,26 @@ class Requestor(object):
             2. msg (str, dict): the text response or, if the response was JSON, the decoded JSON
                dictionary.
         """
-        r = self._session.put(self._base_url + route, auth=(self._username, self._password), **kwargs)
+        r = self._session.put(self._base_url + route, **kwargs)
         return self._handle_response(r)
 
     def stream(self, route, path):
-        """Issues an HTTP ``PUT`` request.
+        """Issues an HTTP ``GET`` request, streaming the response to a file.
 
         Parameters:
             route (str): The API route to use in the request.
-            path (str): The file path to stream the request response.
+            path (str or file): The file path, or a writable binary file object, to stream the
+                request response.
         """
-        with open(path, 'wb') as file:
-            with self._session.get(self._base_url + route, auth=(self._username, self._password), stream=True) as r:
-                if r.status_code >= 400: # pragma: no cover (difficult to hit)
-                    raise HttpError(r.status_code, r.text)
-                for chunk in r.iter_content(chunk_size=5242880):
-                    if chunk:
-                        file.write(chunk)
-                    else: # pragma: no cover (included for completeness)
-                        pass
+        if isinstance(path, str):
+            with open(path, 'wb') as file:
+                self._stream_to(route, file)
+        else:
+            self._stream_to(route, path)
+
+    def _stream_to(self, route, file):
+        with self._session.get(self._base_url + route, stream=True) as r:
+            if r.status_code >= 400: # pragma: no cover (difficult to hit)
+                raise HttpError(r.status_code, r.text)
+            r.raw.decode_content = True
+            shutil.copyfileobj(r.raw, file, length=1048576)
@@ -161,7 +161,7 @@ class Roles(object):
                 for role in pk.roles.query():
                     print(role.name)
         """
-        _, roles = self._requestor.get('/roles')
+        _, roles = self._requestor.get_revalidated('/roles')
         return [RoleSummary(self, role) for role in roles]
 
 class RoleSummary(object):
@@ -5,6 +5,7 @@ __all__ = [
 import requests
 import re
 from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .Exceptions import HttpError
 
@@ -12,7 +13,7 @@ from .Exceptions import HttpError
 class RtvRequestor(object):
     """A class used for issuing requests for the RT Visualizer API"""
 
-    def __init__(self, base_url, username, password, max_retries=3):
+    def __init__(self, base_url, username, password, max_retries=3, pool_maxsize=16):
         """Initializes the RtvRequestor class.
 
         Parameters:
@@ -20,18 +21,22 @@ class RtvRequestor(object):
             username (str): The string used in Basic Authentication as the user name.
             password (str): The string used in Basic Authentication as the user password.
             max_retries (int, optional): The maximum number of for failed connection attempts.
+            pool_maxsize (int, optional): The maximum number of keep-alive connections to hold
+                open per host. Connections are reused across requests to avoid repeating the
+                TCP/TLS handshake.
         """
-        self._username = username
-        self._password = password
         self._base_url = base_url
         self._source = None
         self._session = requests.Session()
-        self._session.mount('http', HTTPAdapter(max_retries=max_retries))
-        self._session.mount('https', HTTPAdapter(max_retries=max_retries))
+        self._session.auth = (username, password)
+        retry = Retry(total=max_retries, backoff_factor=0.2)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry)
+        self._session.mount('http', adapter)
+        self._session.mount('https', adapter)
     
     def _get_prefix(self):
         if self._source is None:
-            r = self._session.get(self._base_url + "/ui/variables.js", auth=(self._username, self._password))
+            r = self._session.get(self._base_url + "/ui/variables.js")
             match = re.search(r'"rtVisualizerSourceName":"([\w-]+)"', r.text)
             self._source = match.group(1)
         return self._base_url + "/rtv/" + self._source
@@ -1,6 +1,7 @@
 import re
 
 from .Exceptions import ScorecardTemplateLookupError
+from .Utils import index_by_id_and_name
 
 
 class ScorecardTemplates(object):
@@ -21,6 +22,14 @@ class ScorecardTemplates(object):
         self._proknow = proknow
         self._requestor = requestor
         self._cache = None
+        self._index = None
+
+    def _get_index(self):
+        if self._cache is None:
+            self.query()
+        if self._index is None:
+            self._index = index_by_id_and_name(self._cache)
+        return self._index
 
     def create(self, name, computed, custom):
         """Creates a new scorecard template.
@@ -90,6 +99,7 @@ class ScorecardTemplates(object):
         body = {'name': name, 'computed': computed, 'custom': custom}
         _, scorecard = self._requestor.post('/metrics/templates', json=body)
         self._cache = None
+        self._index = None
         return ScorecardTemplateItem(self, scorecard)
 
     def delete(self, scorecard_id):
@@ -114,6 +124,7 @@ class ScorecardTemplates(object):
         assert isinstance(scorecard_id, str), "`scorecard_id` is required as a string."
         self._requestor.delete('/metrics/templates/' + scorecard_id)
         self._cache = None
+        self._index = None
 
     def find(self, predicate=None, **props):
         """Finds the first scorecard that matches the input paramters.
@@ -220,15 +231,8 @@ class ScorecardTemplates(object):
         """
         assert isinstance(name, str), "`name` is required as a string."
 
-        if self._cache is None:
-            self.query()
-        normalized = name.lower()
-        for item in self._cache:
-            if item.name.lower() == normalized:
-                scorecard_template = item
-                break
-        else:
-            scorecard_template = None
+        _, by_name = self._get_index()
+        scorecard_template = by_name.get(name.lower())
         if scorecard_template is None:
             raise ScorecardTemplateLookupError("Scorecard template with name `" + name + "` not found.")
         return scorecard_template
@@ -251,7 +255,8 @@ class ScorecardTemplates(object):
         """
         assert isinstance(scorecard_template_id, str), "`scorecard_template_id` is required as a string."
 
-        scorecard_template = self.find(id=scorecard_template_id)
+        by_id, _ = self._get_index()
+        scorecard_template = by_id.get(scorecard_template_id)
         if scorecard_template is None:
             raise ScorecardTemplateLookupError("Scorecard template with id `" + scorecard_template_id + "` not found.")
         return scorecard_template
@@ -276,8 +281,9 @@ class ScorecardTemplates(object):
                 for scorecard in pk.scorecard_templates.query():
                     print(scorecard.name)
         """
-        _, scorecards = self._requestor.get('/metrics/templates')
+        _, scorecards = self._requestor.get_revalidated('/metrics/templates')
         self._cache = [ScorecardTemplateSummary(self, scorecard) for scorecard in scorecards]
+        self._index = None
         return self._cache
 
 class ScorecardTemplateSummary(object):
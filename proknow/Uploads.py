@@ -34,14 +34,12 @@ class Uploads(object):
             "path": path
         }
 
-        # Generate hash and determine file size
-        md5 = hashlib.md5()
+        # Read the file once; the multipart chunk request needs the whole body in memory anyway, so
+        # the same bytes are used to generate the hash and determine the file size
         with open(path, 'rb') as f:
-            blocksize = 128 * md5.block_size
-            for chunk in iter(lambda: f.read(blocksize), b''):
-                md5.update(chunk)
-        checksum = md5.hexdigest()
-        filesize = os.path.getsize(path)
+            content = f.read()
+        checksum = hashlib.md5(content).hexdigest()
+        filesize = len(content)
 
         # Create upload
         body = {
@@ -69,12 +67,12 @@ class Uploads(object):
             "flowFilename": path,
             "flowMultipart": False,
         }, files={
-            "file": open(path, 'rb'),
+            "file": (os.path.basename(path), content),
         })
 
         return result
 
-    def upload(self, workspace, path_or_paths, overrides=None, scope=None, wait=True):
+    def upload(self, workspace, path_or_paths, overrides=None, scope=None, wait=True, max_workers=8):
         """Initiates an upload or series of uploads to the API.
 
         Parameters:
@@ -86,6 +84,7 @@ class Uploads(object):
                 optional override parameters ``"mrn"``, ``"name"``, ``"birth_date"``, and ``"sex"``.
             scope (str, optional): The upload scope.
             wait (bool, optional): Whether to wait for the uploads to reach a terminal state.
+            max_workers (int, optional): The maximum number of files to upload concurrently.
 
         Returns:
             :class:`proknow.Uploads.UploadBatch`: If ``wait`` is True, an object used to manage a
@@ -156,7 +155,7 @@ class Uploads(object):
         ids = [workspace_id] * len(upload_file_paths)
         override_list = [overrides] * len(upload_file_paths)
         scopes = [scope] * len(upload_file_paths)
-        with ThreadPoolExecutor(max_workers=4) as executor:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
             items = list(executor.map(self._upload_file, ids, upload_file_paths, override_list, scopes))
 
         # Wait for uploads to come to terminal state
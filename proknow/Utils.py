@@ -0,0 +1,25 @@
+__all__ = [
+    'index_by_id_and_name',
+]
+
+
+def index_by_id_and_name(items):
+    """Builds lookup dictionaries for a list of items that have ``id`` and ``name`` attributes.
+
+    Parameters:
+        items (list): The items to index.
+
+    Returns:
+        tuple: A tuple (by_id, by_name).
+
+        1. by_id (dict): the items keyed by id
+        2. by_name (dict): the items keyed by lower case name
+
+        When two items share a key, the first one in the list is kept.
+    """
+    by_id = {}
+    by_name = {}
+    for item in items:
+        by_id.setdefault(item.id, item)
+        by_name.setdefault(item.name.lower(), item)
+    return (by_id, by_name)
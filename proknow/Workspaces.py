@@ -329,7 +329,7 @@ class WorkspaceItem(object):
                 patients = pk.patients.lookup('Clinical', ['HNC-0522c0009'])
                 workspace.update_entities({
                     "frame_of_referance": "1.3.6.1.4.1.22213.2.26558.1"
-                }, patient.find_entities(lambda entity: True))
+                }, patient.list_entities())
         """
         entity_ids = []
         for entity in entities:
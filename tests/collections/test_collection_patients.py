@@ -3,61 +3,21 @@ import os
 
 from proknow import Exceptions
 
-def test_collection_patients(app, workspace_generator, collection_generator):
-    pk = app.pk
-
-    _, workspace = workspace_generator()
-    batch = pk.uploads.upload(workspace.id, "./data/Becker^Matthew")
-    path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_Plan1.dcm")
-    patient_summary = batch.find_patient(path)
-    entity_summary = batch.find_entity(path)
-
-    # Create workspace collection
-    _, collection = collection_generator(type="workspace", workspaces=[workspace.id])
-
-    # Verify collection is empty
-    patients = collection.patients.query()
-    assert len(patients) == 0
-
-    # Verify patient added to the collection
-    collection.patients.add(workspace.id, [{
-        "patient": patient_summary.id,
-        "entity": entity_summary.id,
-    }])
-    patients = collection.patients.query()
-    assert len(patients) == 1
-    patient = patients[0]
-    assert patient.id == patient_summary.id
-    assert patient.entity_id == entity_summary.id
-    assert isinstance(patient.data, dict)
-
-    # Verify patient is removed from collection
-    collection.patients.remove(workspace.id, [{
-        "patient": patient_summary.id
-    }])
-    patients = collection.patients.query()
-    assert len(patients) == 0
+BECKER_PATH = os.path.abspath("./data/Becker^Matthew")
+PLAN_PATH = os.path.join(BECKER_PATH, "HNC0522c0009_Plan1.dcm")
 
-    # Verify patient without representative entity is added to the collection
-    collection.patients.add(workspace.id, [{
-        "patient": patient_summary.id
-    }])
-    patients = collection.patients.query()
-    assert len(patients) == 1
-    patient = patients[0]
-    assert patient.id == patient_summary.id
-    assert patient.entity_id is None
-    assert isinstance(patient.data, dict)
+@pytest.fixture(scope="module")
+def becker_upload(app, module_workspace_generator):
+    # Adding a patient to a collection does not modify the patient, so the tests share one upload
+    _, workspace = module_workspace_generator()
+    batch = app.pk.uploads.upload(workspace.id, BECKER_PATH)
+    return (workspace, batch.find_patient(PLAN_PATH), batch.find_entity(PLAN_PATH))
 
-    # Verify patient is removed from collection
-    collection.patients.remove(workspace.id, [{
-        "patient": patient_summary.id
-    }])
-    patients = collection.patients.query()
-    assert len(patients) == 0
+@pytest.mark.parametrize("collection_type", ["workspace", "organization"])
+def test_collection_patients(becker_upload, collection_generator, collection_type):
+    workspace, patient_summary, entity_summary = becker_upload
 
-    # Create organization collection
-    _, collection = collection_generator(workspaces=[workspace.id])
+    _, collection = collection_generator(type=collection_type, workspaces=[workspace.id])
 
     # Verify collection is empty
     patients = collection.patients.query()
@@ -109,15 +69,9 @@ def test_collection_patients_query(app, workspace_generator, collection_generato
     patients = collection.patients.query()
     assert len(patients) == 0
 
-def test_collection_patients_failure(app, workspace_generator, collection_generator):
-    pk = app.pk
-
-    _, workspace = workspace_generator()
+def test_collection_patients_failure(becker_upload, collection_generator):
+    workspace, patient_summary, entity_summary = becker_upload
     _, collection = collection_generator(workspaces=[workspace.id])
-    batch = pk.uploads.upload(workspace.id, "./data/Becker^Matthew")
-    path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_Plan1.dcm")
-    patient_summary = batch.find_patient(path)
-    entity_summary = batch.find_entity(path)
 
     # Assert exception is raised
     with pytest.raises(Exceptions.WorkspaceLookupError) as err_wrapper:
@@ -134,15 +88,9 @@ def test_collection_patients_failure(app, workspace_generator, collection_genera
         }])
     assert err_wrapper.value.message == 'Workspace with name `Does Not Exist` not found.'
 
-def test_collection_patients_get(app, workspace_generator, collection_generator):
-    pk = app.pk
-
-    _, workspace = workspace_generator()
+def test_collection_patients_get(becker_upload, collection_generator):
+    workspace, patient_summary, entity_summary = becker_upload
     _, collection = collection_generator(workspaces=[workspace.id])
-    batch = pk.uploads.upload(workspace.id, "./data/Becker^Matthew")
-    path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_Plan1.dcm")
-    patient_summary = batch.find_patient(path)
-    entity_summary = batch.find_entity(path)
     collection.patients.add(workspace.id, [{
         "patient": patient_summary.id,
         "entity": entity_summary.id,
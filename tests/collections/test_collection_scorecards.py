@@ -3,7 +3,10 @@ import re
 
 from proknow import Exceptions
 
-def test_create(app, collection_generator, custom_metric_generator):
+FIND_EXPR = re.compile(r"nd Score")
+LOWER_EXPR = re.compile(r"score")
+
+def test_create(app, collection_generator, custom_metric_generator, make_computed):
     pk = app.pk
 
     _, collection = collection_generator()
@@ -15,37 +18,7 @@ def test_create(app, collection_generator, custom_metric_generator):
     assert len(scorecard.custom) == 0
     assert isinstance(scorecard.data, dict)
 
-    scorecard = collection.scorecards.create("My Scorecard 2", [{
-        "type": "VOLUME",
-        "roi_name": "BRAINSTEM",
-        "arg_1": None,
-        "arg_2": None
-    }, {
-        "type": "VOLUME_CC_DOSE_RANGE_ROI",
-        "roi_name": "BRAINSTEM",
-        "arg_1": 30,
-        "arg_2": 60,
-        "objectives": [{
-            "label": "IDEAL",
-            "color": [18, 191, 0],
-            "max": 0
-        }, {
-            "label": "GOOD",
-            "color": [136, 223, 127],
-            "max": 3
-        }, {
-            "label": "ACCEPTABLE",
-            "color": [255, 216, 0],
-            "max": 6
-        }, {
-            "label": "MARGINAL",
-            "color": [255, 102, 0],
-            "max": 9
-        }, {
-            "label": "UNACCEPTABLE",
-            "color": [255, 0, 0]
-        }]
-    }], [{
+    scorecard = collection.scorecards.create("My Scorecard 2", make_computed(), [{
         "id": custom_metric.id
     }])
     assert scorecard.name == "My Scorecard 2"
@@ -72,12 +45,8 @@ def test_delete(app, collection_generator):
 
     # Verify scorecard was deleted successfully
     scorecard.delete()
-    for scorecard in collection.scorecards.query():
-        if scorecard.name == "My Scorecard":
-            match = scorecard
-            break
-    else:
-        match = None
+    scorecards = {scorecard.name: scorecard for scorecard in collection.scorecards.query()}
+    match = scorecards.get("My Scorecard")
     assert match is None
 
 def test_delete_failure(app, collection_generator):
@@ -98,15 +67,13 @@ def test_find(app, collection_generator):
 
     _, collection = collection_generator()
     scorecard = collection.scorecards.create("Find Scorecards Test", [], [])
-    expr = re.compile(r"nd Score")
-    expr2 = re.compile(r"score")
 
     # Find with no args
     found = collection.scorecards.find()
     assert found is None
 
     # Find using predicate
-    found = collection.scorecards.find(lambda p: expr.search(p.data["name"]) is not None)
+    found = collection.scorecards.find(lambda p: FIND_EXPR.search(p.data["name"]) is not None)
     assert found is not None
     assert found.name == "Find Scorecards Test"
     scorecard = found.get()
@@ -122,7 +89,7 @@ def test_find(app, collection_generator):
     assert len(scorecard.custom) == 0
 
     # Find using both
-    found = collection.scorecards.find(lambda p: expr.search(p.data["name"]) is not None, name="Find Scorecards Test")
+    found = collection.scorecards.find(lambda p: FIND_EXPR.search(p.data["name"]) is not None, name="Find Scorecards Test")
     assert found is not None
     assert found.name == "Find Scorecards Test"
     scorecard = found.get()
@@ -130,7 +97,7 @@ def test_find(app, collection_generator):
     assert len(scorecard.custom) == 0
 
     # Find failure
-    found = collection.scorecards.find(lambda p: expr2.search(p.data["name"]) is not None)
+    found = collection.scorecards.find(lambda p: LOWER_EXPR.search(p.data["name"]) is not None)
     assert found is None
     found = collection.scorecards.find(name="Find Scorecards")
     assert found is None
@@ -139,32 +106,24 @@ def test_query(app, collection_generator):
     pk = app.pk
 
     _, collection = collection_generator()
-    scorecard = collection.scorecards.create("My Scorecard 1", [], [])
-    scorecard = collection.scorecards.create("My Scorecard 2", [], [])
+    collection.scorecards.create("My Scorecard 1", [], [])
+    collection.scorecards.create("My Scorecard 2", [], [])
+
+    scorecards = {scorecard.name: scorecard for scorecard in collection.scorecards.query()}
 
     # Verify scorecard 1
-    for scorecard in collection.scorecards.query():
-        if scorecard.name == "My Scorecard 1":
-            match = scorecard
-            break
-    else:
-        match = None
-    assert scorecard is not None
-    assert isinstance(scorecard.id, str)
-    assert scorecard.name == "My Scorecard 1"
+    match = scorecards.get("My Scorecard 1")
+    assert match is not None
+    assert isinstance(match.id, str)
+    assert match.name == "My Scorecard 1"
 
     # Verify scorecard 2
-    for scorecard in collection.scorecards.query():
-        if scorecard.name == "My Scorecard 2":
-            match = scorecard
-            break
-    else:
-        match = None
-    assert scorecard is not None
-    assert isinstance(scorecard.id, str)
-    assert scorecard.name == "My Scorecard 2"
+    match = scorecards.get("My Scorecard 2")
+    assert match is not None
+    assert isinstance(match.id, str)
+    assert match.name == "My Scorecard 2"
 
-def test_update(app, collection_generator, custom_metric_generator):
+def test_update(app, collection_generator, custom_metric_generator, make_computed):
     pk = app.pk
 
     _, collection = collection_generator()
@@ -173,48 +132,13 @@ def test_update(app, collection_generator, custom_metric_generator):
 
     # Verify patient scorecard was updated successfully
     scorecard.name = "My Scorecard Updated"
-    scorecard.computed = [{
-        "type": "VOLUME",
-        "roi_name": "BRAINSTEM",
-        "arg_1": None,
-        "arg_2": None
-    }, {
-        "type": "VOLUME_CC_DOSE_RANGE_ROI",
-        "roi_name": "BRAINSTEM",
-        "arg_1": 30,
-        "arg_2": 60,
-        "objectives": [{
-            "label": "IDEAL",
-            "color": [18, 191, 0],
-            "max": 0
-        }, {
-            "label": "GOOD",
-            "color": [136, 223, 127],
-            "max": 3
-        }, {
-            "label": "ACCEPTABLE",
-            "color": [255, 216, 0],
-            "max": 6
-        }, {
-            "label": "MARGINAL",
-            "color": [255, 102, 0],
-            "max": 9
-        }, {
-            "label": "UNACCEPTABLE",
-            "color": [255, 0, 0]
-        }]
-    }]
+    scorecard.computed = make_computed()
     scorecard.custom = [{
         "id": custom_metric.id
     }]
     scorecard.save()
-    scorecards = collection.scorecards.query()
-    for scorecard in scorecards:
-        if scorecard.name == "My Scorecard Updated":
-            scorecard_match = scorecard
-            break
-    else:
-        scorecard_match = None
+    scorecards = {scorecard.name: scorecard for scorecard in collection.scorecards.query()}
+    scorecard_match = scorecards.get("My Scorecard Updated")
     assert scorecard_match is not None
     scorecard_item = scorecard_match.get()
     assert scorecard_item.name == "My Scorecard Updated"
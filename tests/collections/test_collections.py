@@ -3,6 +3,8 @@ import re
 
 from proknow import Exceptions
 
+FIND_EXPR = re.compile(r"ind")
+
 def test_create_collections(app, workspace_generator):
     pk = app.pk
 
@@ -15,13 +17,8 @@ def test_create_collections(app, workspace_generator):
     assert collection.description == "Test Desc"
 
     # Assert item can be found in query
-    collections = pk.collections.query()
-    for collection in collections:
-        if collection.name == "Create Organization Collection 1":
-            collection_match = collection
-            break
-    else:
-        collection_match = None
+    collections = {collection.name: collection for collection in pk.collections.query()}
+    collection_match = collections.get("Create Organization Collection 1")
     assert collection_match is not None
     assert collection_match.name == "Create Organization Collection 1"
     assert collection_match.description == "Test Desc"
@@ -33,13 +30,8 @@ def test_create_collections(app, workspace_generator):
     assert collection.description == ""
 
     # Assert item can be found in query
-    collections = pk.collections.query(workspace.id)
-    for collection in collections:
-        if collection.name == "Create Workspace Collection 1":
-            collection_match = collection
-            break
-    else:
-        collection_match = None
+    collections = {collection.name: collection for collection in pk.collections.query(workspace.id)}
+    collection_match = collections.get("Create Workspace Collection 1")
     assert collection_match is not None
     assert collection_match.name == "Create Workspace Collection 1"
     assert collection_match.description == ""
@@ -61,12 +53,8 @@ def test_delete_collections(app, collection_generator):
 
     # Verify collection was deleted successfully
     collection.delete()
-    for collection in pk.collections.query():
-        if collection.name == params["name"]:
-            match = collection
-            break
-    else:
-        match = None
+    collections = {collection.name: collection for collection in pk.collections.query()}
+    match = collections.get(params["name"])
     assert match is None
 
 def test_delete_collections_failure(app, collection_generator):
@@ -86,14 +74,13 @@ def test_find_collections(app, collection_generator):
     pk = app.pk
 
     params, collection = collection_generator(name="Find Me")
-    expr = re.compile(r"ind")
 
     # Find with no args
     found = pk.collections.find()
     assert found is None
 
     # Find using predicate
-    found = pk.collections.find(predicate=lambda ws: expr.search(ws.data["name"]) is not None)
+    found = pk.collections.find(predicate=lambda ws: FIND_EXPR.search(ws.data["name"]) is not None)
     assert found is not None
     assert found.name == params["name"]
     assert found.description == params["description"]
@@ -105,13 +92,13 @@ def test_find_collections(app, collection_generator):
     assert found.description == params["description"]
 
     # Find using both
-    found = pk.collections.find(predicate=lambda ws: expr.search(ws.data["name"]) is not None, id=collection.id, name=params["name"])
+    found = pk.collections.find(predicate=lambda ws: FIND_EXPR.search(ws.data["name"]) is not None, id=collection.id, name=params["name"])
     assert found is not None
     assert found.name == params["name"]
     assert found.description == params["description"]
 
     # Find failure
-    found = pk.collections.find(predicate=lambda ws: expr.search(ws.data["id"]) is not None)
+    found = pk.collections.find(predicate=lambda ws: FIND_EXPR.search(ws.data["id"]) is not None)
     assert found is None
     found = pk.collections.find(id=collection.id, name=params["name"].lower())
     assert found is None
@@ -130,56 +117,38 @@ def test_get_collections(app, workspace_generator, collection_generator):
 def test_query_collections(app, workspace_generator, collection_generator):
     pk = app.pk
 
-    params1, collection1 = collection_generator()
-    params2, collection2 = collection_generator()
+    (params1, collection1), (params2, collection2) = collection_generator(n=2)
+
+    collections = {collection.name: collection for collection in pk.collections.query()}
 
     # Verify test 1
-    for collection in pk.collections.query():
-        if collection.name == params1["name"]:
-            match = collection
-            break
-    else:
-        match = None
+    match = collections.get(params1["name"])
     assert match is not None
     assert match.id == collection1.id
     assert match.name == params1["name"]
     assert match.description == params1["description"]
 
     # Verify test 2
-    for collection in pk.collections.query():
-        if collection.name == params2["name"]:
-            match = collection
-            break
-    else:
-        match = None
+    match = collections.get(params2["name"])
     assert match is not None
     assert match.id == collection2.id
     assert match.name == params2["name"]
     assert match.description == params2["description"]
 
     _, workspace = workspace_generator()
-    params3, collection3 = collection_generator(type="workspace", workspaces=[workspace.id])
-    params4, collection4 = collection_generator(type="workspace", workspaces=[workspace.id])
+    (params3, collection3), (params4, collection4) = collection_generator(n=2, type="workspace", workspaces=[workspace.id])
+
+    collections = {collection.name: collection for collection in pk.collections.query(workspace.id)}
 
     # Verify test 3
-    for collection in pk.collections.query(workspace.id):
-        if collection.name == params3["name"]:
-            match = collection
-            break
-    else:
-        match = None
+    match = collections.get(params3["name"])
     assert match is not None
     assert match.id == collection3.id
     assert match.name == params3["name"]
     assert match.description == params3["description"]
 
     # Verify test 3
-    for collection in pk.collections.query(workspace.id):
-        if collection.name == params4["name"]:
-            match = collection
-            break
-    else:
-        match = None
+    match = collections.get(params4["name"])
     assert match is not None
     assert match.id == collection4.id
     assert match.name == params4["name"]
@@ -196,12 +165,8 @@ def test_update_collections(app, collection_generator):
     collection.name = updated_name
     collection.description = "Updated Collection Description"
     collection.save()
-    for collection in pk.collections.query():
-        if collection.name == updated_name:
-            collection_match = collection
-            break
-    else:
-        collection_match = None
+    collections = {collection.name: collection for collection in pk.collections.query()}
+    collection_match = collections.get(updated_name)
     assert collection_match is not None
     collection = collection_match.get()
     assert collection.name == updated_name
@@ -1,8 +1,11 @@
 import pytest
+import io
+import os
 import tempfile
 import shutil
 import string
 import random
+from concurrent.futures import ThreadPoolExecutor
 
 from .pktestconfig import base_url, credentials_id, credentials_secret
 
@@ -20,45 +23,30 @@ class App():
         self.marked_collections = []
 
     def cleanup(self):
-        for collection in self.marked_collections:
+        # Each kind of resource is removed in dependency order, but resources of the same kind are
+        # independent of one another and are deleted concurrently
+        self._delete_all("collection", self.marked_collections)
+        self._delete_all("custom metric", self.marked_custom_metrics)
+        self._delete_all("scorecard template", self.marked_scorecard_templates)
+        self._delete_all("user", self.marked_users)
+        self._delete_all("role", self.marked_roles)
+        self._delete_all("workspace", self.marked_workspaces, self._delete_workspace)
+
+    def _delete_workspace(self, workspace):
+        if workspace.data["protected"] == True:
+            workspace.protected = False
+            workspace.save()
+        workspace.delete()
+
+    def _delete_all(self, kind, items, delete=lambda item: item.delete()):
+        def _delete(item):
             try:
-                collection.delete()
+                delete(item)
             except:
-                print('Error deleting collection: ' + collection.name)
-                pass
-        for custom_metric in self.marked_custom_metrics:
-            try:
-                custom_metric.delete()
-            except:
-                print('Error deleting custom metric: ' + custom_metric.name)
-                pass
-        for scorecard_template in self.marked_scorecard_templates:
-            try:
-                scorecard_template.delete()
-            except:
-                print('Error deleting scorecard template: ' + scorecard_template.name)
-                pass
-        for user in self.marked_users:
-            try:
-                user.delete()
-            except:
-                print('Error deleting user: ' + user.name)
-                pass
-        for role in self.marked_roles:
-            try:
-                role.delete()
-            except:
-                print('Error deleting role: ' + role.name)
-                pass
-        for workspace in self.marked_workspaces:
-            try:
-                if workspace.data["protected"] == True:
-                    workspace.protected = False
-                    workspace.save()
-                workspace.delete()
-            except:
-                print('Error deleting workspace: ' + workspace.name)
-                pass
+                print('Error deleting ' + kind + ': ' + item.name)
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(_delete, items))
 
 def generate_string(size=10, lowercase_only=False):
     if lowercase_only:
@@ -67,6 +55,13 @@ def generate_string(size=10, lowercase_only=False):
         characters = string.ascii_letters + string.digits
     return ''.join(random.choice(characters) for _ in range(size))
 
+def generate_many(create, n, **args):
+    # Issues n independent create calls concurrently, at most 8 at a time, and returns their
+    # results in order
+    with ThreadPoolExecutor(max_workers=min(n, 8) or 1) as executor:
+        futures = [executor.submit(create, **args) for _ in range(n)]
+    return [future.result() for future in futures]
+
 @pytest.fixture(scope="module")
 def app():
     proknow = App()
@@ -78,7 +73,9 @@ def collection_generator(app):
     pk = app.pk
     resource_prefix = app.resource_prefix
 
-    def _create_collection(do_not_mark=False, **args):
+    def _create_collection(do_not_mark=False, n=None, **args):
+        if n is not None:
+            return generate_many(_create_collection, n, do_not_mark=do_not_mark, **args)
         params = {
             "name": resource_prefix + generate_string(),
             "description": generate_string(),
@@ -100,7 +97,9 @@ def custom_metric_generator(app):
     pk = app.pk
     resource_prefix = app.resource_prefix
 
-    def _create_custom_metric(do_not_mark=False, **args):
+    def _create_custom_metric(do_not_mark=False, n=None, **args):
+        if n is not None:
+            return generate_many(_create_custom_metric, n, do_not_mark=do_not_mark, **args)
         params = {
             "name": resource_prefix + generate_string(),
             "context": "patient",
@@ -123,7 +122,9 @@ def scorecard_template_generator(app):
     pk = app.pk
     resource_prefix = app.resource_prefix
 
-    def _create_scorecard_template(do_not_mark=False, **args):
+    def _create_scorecard_template(do_not_mark=False, n=None, **args):
+        if n is not None:
+            return generate_many(_create_scorecard_template, n, do_not_mark=do_not_mark, **args)
         params = {
             "name": resource_prefix + generate_string(),
             "computed": [],
@@ -139,27 +140,91 @@ def scorecard_template_generator(app):
 
     return _create_scorecard_template
 
+@pytest.fixture
+def make_computed():
+    # Builds the two computed metrics that the scorecard and scorecard template tests share. Each
+    # call returns a fresh list, since scorecard items keep a reference to the list they are given.
+    # With rx, each metric also carries explicit rx and rx_scale fields.
+    def _make_computed(rx=False):
+        computed = [{
+            "type": "VOLUME",
+            "roi_name": "BRAINSTEM",
+            "arg_1": None,
+            "arg_2": None
+        }, {
+            "type": "VOLUME_CC_DOSE_RANGE_ROI",
+            "roi_name": "BRAINSTEM",
+            "arg_1": 30,
+            "arg_2": 60,
+            "objectives": [{
+                "label": "IDEAL",
+                "color": [18, 191, 0],
+                "max": 0
+            }, {
+                "label": "GOOD",
+                "color": [136, 223, 127],
+                "max": 3
+            }, {
+                "label": "ACCEPTABLE",
+                "color": [255, 216, 0],
+                "max": 6
+            }, {
+                "label": "MARGINAL",
+                "color": [255, 102, 0],
+                "max": 9
+            }, {
+                "label": "UNACCEPTABLE",
+                "color": [255, 0, 0]
+            }]
+        }]
+        if rx:
+            for metric in computed:
+                metric.update({'rx': None, 'rx_scale': None})
+        return computed
+
+    return _make_computed
+
+def upload_entity(pk, workspace_id, path_or_paths, **args):
+    batch = pk.uploads.upload(workspace_id, path_or_paths)
+    length = len(batch.patients)
+    assert length == 1, "entity_generator: only 1 patient at a time supported; got " + length
+    if len(args) > 0:
+        entities = batch.patients[0].get().find_entities(**args)
+        length = len(entities)
+        assert length == 1, "entity_generator: only 1 entity at a time supported; got " + length
+        return entities[0].get()
+    else:
+        length = len(batch.patients[0].entities)
+        assert length == 1, "entity_generator: only 1 entity at a time supported; got " + length
+        return batch.patients[0].entities[0].get()
+
 @pytest.fixture
 def entity_generator(app, workspace_generator):
     pk = app.pk
 
     def _create_entity(path_or_paths, **args):
         _, workspace = workspace_generator()
-        batch = pk.uploads.upload(workspace.id, path_or_paths)
-        length = len(batch.patients)
-        assert length == 1, "entity_generator: only 1 patient at a time supported; got " + length
-        if len(args) > 0:
-            entities = batch.patients[0].get().find_entities(**args)
-            length = len(entities)
-            assert length == 1, "entity_generator: only 1 entity at a time supported; got " + length
-            return entities[0].get()
-        else:
-            length = len(batch.patients[0].entities)
-            assert length == 1, "entity_generator: only 1 entity at a time supported; got " + length
-            return batch.patients[0].entities[0].get()
+        return upload_entity(pk, workspace.id, path_or_paths, **args)
 
     return _create_entity
 
+@pytest.fixture(scope="module")
+def readonly_entity_generator(app, module_workspace_generator):
+    pk = app.pk
+    entities = {}
+
+    # Like entity_generator, but each distinct upload happens once per module. Only use this for
+    # tests that do not modify the returned entity.
+    def _get_entity(path_or_paths, **args):
+        paths = path_or_paths if isinstance(path_or_paths, list) else [path_or_paths]
+        key = (tuple(os.path.abspath(path) for path in paths), tuple(sorted(args.items())))
+        if key not in entities:
+            _, workspace = module_workspace_generator()
+            entities[key] = upload_entity(pk, workspace.id, path_or_paths, **args)
+        return entities[key]
+
+    return _get_entity
+
 @pytest.fixture
 def patient_generator(app, workspace_generator):
     pk = app.pk
@@ -178,7 +243,9 @@ def role_generator(app):
     pk = app.pk
     resource_prefix = app.resource_prefix
 
-    def _create_role(do_not_mark=False, **args):
+    def _create_role(do_not_mark=False, n=None, **args):
+        if n is not None:
+            return generate_many(_create_role, n, do_not_mark=do_not_mark, **args)
         params = {
             "name": resource_prefix + generate_string(),
             "description": resource_prefix + generate_string(),
@@ -198,9 +265,29 @@ def role_generator(app):
 
     return _create_role
 
+@pytest.fixture
+def response_recorder(app):
+    # Collects every response the shared client receives during a test through a requests session
+    # hook, which is removed again afterwards
+    responses = []
+
+    def _record(response, *args, **kwargs):
+        responses.append(response)
+
+    hooks = app.pk.requestor._session.hooks["response"]
+    hooks.append(_record)
+    yield responses
+    hooks.remove(_record)
+
 class TempDirectory(object):
+    # Prefer a RAM-backed tmpfs where available so downloads in tests never touch the disk
+    shm = "/dev/shm"
+
     def __init__(self):
-        self.path = tempfile.mkdtemp()
+        if os.path.isdir(self.shm) and os.access(self.shm, os.W_OK):
+            self.path = tempfile.mkdtemp(prefix="proknow-tests-", dir=self.shm)
+        else:
+            self.path = tempfile.mkdtemp()
 
     def cleanup(self):
         shutil.rmtree(self.path)
@@ -211,12 +298,39 @@ def temp_directory():
     yield temp
     temp.cleanup()
 
+@pytest.fixture
+def download_checker(temp_directory):
+    def _read(path):
+        with open(path, 'rb') as file:
+            return file.read()
+
+    # Checks the download contract shared by entities: to a directory, to a specific file, and to
+    # a file object. The source file is read once and each download is compared against it.
+    def _check_download(entity, source_path, filename):
+        expected = _read(source_path)
+
+        download_path = entity.download(temp_directory.path)
+        assert _read(download_path) == expected
+
+        specific_path = os.path.join(temp_directory.path, filename)
+        download_path = entity.download(specific_path)
+        assert specific_path == download_path
+        assert _read(download_path) == expected
+
+        with io.BytesIO() as buffer:
+            assert entity.download(buffer) is buffer
+            assert buffer.getvalue() == expected
+
+    return _check_download
+
 @pytest.fixture
 def user_generator(app):
     pk = app.pk
     resource_prefix = app.resource_prefix
 
-    def _create_user(do_not_mark=False, **args):
+    def _create_user(do_not_mark=False, n=None, **args):
+        if n is not None:
+            return generate_many(_create_user, n, do_not_mark=do_not_mark, **args)
         params = {
             "email": resource_prefix + generate_string(lowercase_only=True) + '@proknow.com',
             "name": generate_string()
@@ -231,23 +345,34 @@ def user_generator(app):
 
     return _create_user
 
+def create_workspace(app, do_not_mark=False, **args):
+    resource_prefix = app.resource_prefix
+    params = {
+        "slug": resource_prefix + generate_string(lowercase_only=True),
+        "name": generate_string(),
+        "protected": False
+    }
+    params.update(args)
+    if params["slug"].find(resource_prefix) != 0:
+        params["slug"] = resource_prefix + params["slug"]
+    workspace = app.pk.workspaces.create(**params)
+    if do_not_mark is False:
+        app.marked_workspaces.append(workspace)
+    return (params, workspace)
+
 @pytest.fixture
 def workspace_generator(app):
-    pk = app.pk
-    resource_prefix = app.resource_prefix
+    def _create_workspace(do_not_mark=False, n=None, **args):
+        if n is not None:
+            return generate_many(_create_workspace, n, do_not_mark=do_not_mark, **args)
+        return create_workspace(app, do_not_mark, **args)
+
+    return _create_workspace
 
+@pytest.fixture(scope="module")
+def module_workspace_generator(app):
+    # Like workspace_generator, but for module-scoped fixtures whose setup is shared across tests
     def _create_workspace(do_not_mark=False, **args):
-        params = {
-            "slug": resource_prefix + generate_string(lowercase_only=True),
-            "name": generate_string(),
-            "protected": False
-        }
-        params.update(args)
-        if params["slug"].find(resource_prefix) != 0:
-            params["slug"] = resource_prefix + params["slug"]
-        workspace = pk.workspaces.create(**params)
-        if do_not_mark is False:
-            app.marked_workspaces.append(workspace)
-        return (params, workspace)
+        return create_workspace(app, do_not_mark, **args)
 
     return _create_workspace
@@ -3,6 +3,8 @@ import re
 
 from proknow import Exceptions
 
+FIND_EXPR = re.compile(r"ind")
+
 def test_create(app, role_generator):
     pk = app.pk
 
@@ -15,12 +17,8 @@ def test_create(app, role_generator):
         assert role.permissions[key] == value
 
     # Assert item can be found in query
-    for role in pk.roles.query():
-        if role.name == params["name"]:
-            role_match = role
-            break
-    else:
-        role_match = None
+    roles = {role.name: role for role in pk.roles.query()}
+    role_match = roles.get(params["name"])
     assert role_match is not None
     role = role_match.get()
     assert isinstance(role.data["id"], str)
@@ -47,12 +45,8 @@ def test_delete(app, role_generator):
 
     # Verify role was deleted successfully
     role.delete()
-    for role in pk.roles.query():
-        if role.name == params["name"]:
-            match = role
-            break
-    else:
-        match = None
+    roles = {role.name: role for role in pk.roles.query()}
+    match = roles.get(params["name"])
     assert match is None
 
 def test_delete_failure(app, role_generator):
@@ -71,14 +65,13 @@ def test_find(app, role_generator):
     pk = app.pk
 
     params, role = role_generator(name="Find Me")
-    expr = re.compile(r"ind")
 
     # Find with no args
     found = pk.roles.find()
     assert found is None
 
     # Find using predicate
-    found = pk.roles.find(lambda ws: expr.search(ws.data["name"]) is not None)
+    found = pk.roles.find(lambda ws: FIND_EXPR.search(ws.data["name"]) is not None)
     assert found is not None
     assert found.name == params["name"]
 
@@ -88,12 +81,12 @@ def test_find(app, role_generator):
     assert found.name == params["name"]
 
     # Find using both
-    found = pk.roles.find(lambda ws: expr.search(ws.data["name"]) is not None, id=role.id, name=params["name"])
+    found = pk.roles.find(lambda ws: FIND_EXPR.search(ws.data["name"]) is not None, id=role.id, name=params["name"])
     assert found is not None
     assert found.name == params["name"]
 
     # Find failure
-    found = pk.roles.find(lambda ws: expr.search(ws.data["id"]) is not None)
+    found = pk.roles.find(lambda ws: FIND_EXPR.search(ws.data["id"]) is not None)
     assert found is None
     found = pk.roles.find(id=role.id, name=params["name"].lower())
     assert found is None
@@ -101,28 +94,41 @@ def test_find(app, role_generator):
 def test_query(app, role_generator):
     pk = app.pk
 
-    params1, _ = role_generator()
-    params2, _ = role_generator()
+    (params1, _), (params2, _) = role_generator(n=2)
 
-    # Verify test 1
-    for role in pk.roles.query():
+    roles = {role.name: role for role in pk.roles.query()}
+    for role in roles.values():
         assert isinstance(role.id, str)
-        if role.name == params1["name"] and role.description == params1["description"]:
-            match = role
-            break
-    else:
-        match = None
+
+    # Verify test 1
+    match = roles.get(params1["name"])
     assert match is not None
+    assert match.description == params1["description"]
 
     # Verify test 2
-    for role in pk.roles.query():
-        assert isinstance(role.id, str)
-        if role.name == params2["name"] and role.description == params2["description"]:
-            match = role
-            break
-    else:
-        match = None
+    match = roles.get(params2["name"])
     assert match is not None
+    assert match.description == params2["description"]
+
+def test_query_revalidates(app, role_generator, response_recorder):
+    pk = app.pk
+
+    role_generator()
+
+    # Verify the second query sends the ETag stored by the first and returns the same list
+    roles = pk.roles.query()
+    roles[0].data["name"] = "Edited Locally"
+    requeried = pk.roles.query()
+    first, second = response_recorder[-2:]
+    if first.status_code == 304:
+        etag = first.request.headers.get("If-None-Match")
+    else:
+        etag = first.headers.get("ETag")
+    assert second.request.headers.get("If-None-Match") == etag
+    assert [role.id for role in requeried] == [role.id for role in roles]
+
+    # Verify a local edit to the first result does not leak into the second
+    assert requeried[0].data["name"] != "Edited Locally"
 
 def test_update(app, role_generator):
     pk = app.pk
@@ -135,12 +141,8 @@ def test_update(app, role_generator):
     role.name = updated_name
     role.permissions["collections_read"] = True
     role.save()
-    for role in pk.roles.query():
-        if role.name == updated_name:
-            role_match = role
-            break
-    else:
-        role_match = None
+    roles = {role.name: role for role in pk.roles.query()}
+    role_match = roles.get(updated_name)
     assert role_match is not None
     role = role_match.get()
     assert isinstance(role.data["id"], str)
@@ -256,7 +258,8 @@ def test_update_failure(app, role_generator):
     assert err_wrapper.value.body == '{"type":"ROLE_CONFLICT_NAME","params":{"name":"Owner"},"message":"Role already exists with name \\"Owner\\""}'
 
     # Assert error is raised for system role
-    system_role = pk.roles.find(name='Owner').get()
+    owner_role = pk.roles.find(name='Owner')
+    system_role = owner_role.get()
     with pytest.raises(Exceptions.HttpError) as err_wrapper:
         system_role.description = "New description"
         system_role.permissions["collections_read"] = True
@@ -265,7 +268,7 @@ def test_update_failure(app, role_generator):
     assert err_wrapper.value.body == '{"type":"CANNOT_UPDATE_SYSTEM_ROLE","params":{},"message":"Invalid request to update system role"}'
 
     # Assert error is raised for constant permission
-    system_role = pk.roles.find(name='Owner').get()
+    system_role = owner_role.get()
     with pytest.raises(Exceptions.HttpError) as err_wrapper:
         system_role.description = "New description"
         system_role.permissions["roles_read"] = False
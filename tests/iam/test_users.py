@@ -3,6 +3,8 @@ import re
 
 from proknow import Exceptions
 
+FIND_EXPR = re.compile(r"ind")
+
 def test_create(app, user_generator):
     pk = app.pk
 
@@ -13,12 +15,8 @@ def test_create(app, user_generator):
     assert user.active is True
 
     # Assert item can be found in query
-    for user in pk.users.query():
-        if user.name == params["name"]:
-            user_match = user
-            break
-    else:
-        user_match = None
+    users = {user.name: user for user in pk.users.query()}
+    user_match = users.get(params["name"])
     assert user_match is not None
     user = user_match.get()
     assert isinstance(user.data["id"], str)
@@ -50,12 +48,8 @@ def test_delete(app, user_generator):
 
     # Verify user was deleted successfully
     user.delete()
-    for user in pk.users.query():
-        if user.email == params["email"]:
-            match = user
-            break
-    else:
-        match = None
+    users = {user.email: user for user in pk.users.query()}
+    match = users.get(params["email"])
     assert match is None
 
 def test_delete_failure(app, user_generator):
@@ -74,14 +68,13 @@ def test_find(app, user_generator):
     pk = app.pk
 
     params, user = user_generator(name="Find Me")
-    expr = re.compile(r"ind")
 
     # Find with no args
     found = pk.users.find()
     assert found is None
 
     # Find using predicate
-    found = pk.users.find(lambda ws: expr.search(ws.data["name"]) is not None)
+    found = pk.users.find(lambda ws: FIND_EXPR.search(ws.data["name"]) is not None)
     assert found is not None
     assert found.email == params["email"]
     assert found.name == params["name"]
@@ -93,13 +86,13 @@ def test_find(app, user_generator):
     assert found.name == params["name"]
 
     # Find using both
-    found = pk.users.find(lambda ws: expr.search(ws.data["name"]) is not None, id=user.id, name="Find Me")
+    found = pk.users.find(lambda ws: FIND_EXPR.search(ws.data["name"]) is not None, id=user.id, name="Find Me")
     assert found is not None
     assert found.email == params["email"]
     assert found.name == params["name"]
 
     # Find failure
-    found = pk.users.find(lambda ws: expr.search(ws.data["id"]) is not None)
+    found = pk.users.find(lambda ws: FIND_EXPR.search(ws.data["id"]) is not None)
     assert found is None
     found = pk.users.find(id=user.id, name="Find me")
     assert found is None
@@ -107,28 +100,19 @@ def test_find(app, user_generator):
 def test_query(app, user_generator):
     pk = app.pk
 
-    params1, user1 = user_generator()
-    params2, user2 = user_generator()
+    (params1, user1), (params2, user2) = user_generator(n=2)
+
+    users = {user.email: user for user in pk.users.query()}
 
     # Verify test 1
-    for user in pk.users.query():
-        if user.email == params1["email"]:
-            match = user
-            break
-    else:
-        match = None
+    match = users.get(params1["email"])
     assert match is not None
     assert match.id == user1.id
     assert match.email == params1["email"]
     assert match.name == params1["name"]
 
     # Verify test 2
-    for user in pk.users.query():
-        if user.email == params2["email"]:
-            match = user
-            break
-    else:
-        match = None
+    match = users.get(params2["email"])
     assert match is not None
     assert match.id == user2.id
     assert match.email == params2["email"]
@@ -146,12 +130,8 @@ def test_update(app, user_generator):
     user.name = "Updated User Name"
     user.active = False
     user.save()
-    for user in pk.users.query():
-        if user.email == updated_email:
-            user_match = user
-            break
-    else:
-        user_match = None
+    users = {user.email: user for user in pk.users.query()}
+    user_match = users.get(updated_email)
     assert user_match is not None
     user = user_match.get()
     assert isinstance(user.data["id"], str)
@@ -1,8 +1,19 @@
 import pytest
 import re
+import os
 
 from proknow import Exceptions
 
+BECKER_PATH = os.path.abspath("./data/Becker^Matthew")
+
+FIND_EXPR = re.compile(r"indm")
+
+@pytest.fixture(scope="module")
+def resolvable_workspace(module_workspace_generator):
+    # The resolve tests only read this workspace; a lower case name lets the by-name test check
+    # that matching ignores case
+    return module_workspace_generator(name="workspace-lower1")
+
 def test_create(app, workspace_generator):
     pk = app.pk
 
@@ -13,13 +24,8 @@ def test_create(app, workspace_generator):
     assert created.protected == params["protected"]
 
     # Assert item can be found in query
-    workspaces = pk.workspaces.query()
-    for workspace in workspaces:
-        if workspace.slug == params["slug"]:
-            workspace_match = workspace
-            break
-    else:
-        workspace_match = None
+    workspaces = {workspace.slug: workspace for workspace in pk.workspaces.query()}
+    workspace_match = workspaces.get(params["slug"])
     assert workspace_match is not None
     assert workspace_match.slug == params["slug"]
     assert workspace_match.name == params["name"]
@@ -43,12 +49,8 @@ def test_delete(app, workspace_generator):
 
     # Verify workspace was deleted successfully
     workspace.delete()
-    for workspace in pk.workspaces.query():
-        if workspace.slug == params["slug"]:
-            match = workspace
-            break
-    else:
-        match = None
+    workspaces = {workspace.slug: workspace for workspace in pk.workspaces.query()}
+    match = workspaces.get(params["slug"])
     assert match is None
 
 def test_delete_failure(app, workspace_generator):
@@ -68,14 +70,13 @@ def test_find(app, workspace_generator):
     pk = app.pk
 
     params, _ = workspace_generator(slug="findme", name="Find Me")
-    expr = re.compile(r"indm")
 
     # Find with no args
     found = pk.workspaces.find()
     assert found is None
 
     # Find using predicate
-    found = pk.workspaces.find(lambda ws: expr.search(ws.data["slug"]) is not None)
+    found = pk.workspaces.find(lambda ws: FIND_EXPR.search(ws.data["slug"]) is not None)
     assert found is not None
     assert found.slug == params["slug"]
     assert found.name == params["name"]
@@ -89,14 +90,14 @@ def test_find(app, workspace_generator):
     assert found.protected == params["protected"]
 
     # Find using both
-    found = pk.workspaces.find(lambda ws: expr.search(ws.data["slug"]) is not None, slug=params["slug"], name=params["name"])
+    found = pk.workspaces.find(lambda ws: FIND_EXPR.search(ws.data["slug"]) is not None, slug=params["slug"], name=params["name"])
     assert found is not None
     assert found.slug == params["slug"]
     assert found.name == params["name"]
     assert found.protected == params["protected"]
 
     # Find failure
-    found = pk.workspaces.find(lambda ws: expr.search(ws.data["name"]) is not None)
+    found = pk.workspaces.find(lambda ws: FIND_EXPR.search(ws.data["name"]) is not None)
     assert found is None
     found = pk.workspaces.find(slug="findme", name="Find me")
     assert found is None
@@ -104,37 +105,28 @@ def test_find(app, workspace_generator):
 def test_query(app, workspace_generator):
     pk = app.pk
 
-    params1, _ = workspace_generator()
-    params2, _ = workspace_generator()
+    (params1, _), (params2, _) = workspace_generator(n=2)
+
+    workspaces = {workspace.slug: workspace for workspace in pk.workspaces.query()}
 
     # Verify test 1
-    for workspace in pk.workspaces.query():
-        if workspace.slug == params1["slug"]:
-            match = workspace
-            break
-    else:
-        match = None
+    match = workspaces.get(params1["slug"])
     assert match is not None
     assert match.slug == params1["slug"]
     assert match.name == params1["name"]
     assert match.protected == params1["protected"]
 
     # Verify test 2
-    for workspace in pk.workspaces.query():
-        if workspace.slug == params2["slug"]:
-            match = workspace
-            break
-    else:
-        match = None
+    match = workspaces.get(params2["slug"])
     assert match is not None
     assert match.slug == params2["slug"]
     assert match.name == params2["name"]
     assert match.protected == params2["protected"]
 
-def test_resolve(app, workspace_generator):
+def test_resolve(app, resolvable_workspace):
     pk = app.pk
 
-    params, workspace = workspace_generator()
+    params, workspace = resolvable_workspace
 
     # Test resolve by id
     resolved = pk.workspaces.resolve(workspace.id)
@@ -163,10 +155,10 @@ def test_resolve_failure(app):
         pk.workspaces.resolve("My Workspace")
     assert err_wrapper.value.message == "Workspace with name `My Workspace` not found."
 
-def test_resolve_by_id(app, workspace_generator):
+def test_resolve_by_id(app, resolvable_workspace):
     pk = app.pk
 
-    params, workspace = workspace_generator()
+    params, workspace = resolvable_workspace
 
     resolved = pk.workspaces.resolve_by_id(workspace.id)
     assert resolved is not None
@@ -181,10 +173,10 @@ def test_resolve_by_id_failure(app):
         pk.workspaces.resolve_by_id("00000000000000000000000000000000")
     assert err_wrapper.value.message == "Workspace with id `00000000000000000000000000000000` not found."
 
-def test_resolve_by_name(app, workspace_generator):
+def test_resolve_by_name(app, resolvable_workspace):
     pk = app.pk
 
-    params, workspace = workspace_generator(name="workspace-lower1")
+    params, workspace = resolvable_workspace
 
     resolved = pk.workspaces.resolve_by_name(params["name"])
     assert resolved is not None
@@ -202,7 +194,7 @@ def test_resolve_by_name_failure(app):
     pk = app.pk
 
     with pytest.raises(Exceptions.WorkspaceLookupError) as err_wrapper:
-        pk.workspaces.resolve("My Workspace")
+        pk.workspaces.resolve_by_name("My Workspace")
     assert err_wrapper.value.message == "Workspace with name `My Workspace` not found."
 
 def test_update(app, workspace_generator):
@@ -216,13 +208,8 @@ def test_update(app, workspace_generator):
     workspace.name = "Updated Workspace Name"
     workspace.protected = True
     workspace.save()
-    workspaces = pk.workspaces.query()
-    for workspace in workspaces:
-        if workspace.slug == resource_prefix + "updated":
-            workspace_match = workspace
-            break
-    else:
-        workspace_match = None
+    workspaces = {workspace.slug: workspace for workspace in pk.workspaces.query()}
+    workspace_match = workspaces.get(resource_prefix + "updated")
     assert workspace_match is not None
     assert workspace_match.slug == resource_prefix + "updated"
     assert workspace_match.name == "Updated Workspace Name"
@@ -249,7 +236,7 @@ def test_update_entities(app, workspace_generator):
 
     patient.upload([
         "./data/Jensen^Myrtle/HNC0522c0013_CT1_image00000.dcm",
-        "./data/Becker^Matthew/HNC0522c0009_CT1_image00000.dcm",
+        os.path.join(BECKER_PATH, "HNC0522c0009_CT1_image00000.dcm"),
     ])
     patient.refresh()
     image_sets = [entity.get() for entity in patient.find_entities(type="image_set")]
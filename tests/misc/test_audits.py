@@ -1,9 +1,12 @@
 import pytest
 import datetime
+import os
 
 from proknow.Audit import Audit
 from proknow.Exceptions import HttpError
 
+BECKER_PATH = os.path.abspath("./data/Becker^Matthew")
+
 def test_query(app, user_generator):
     audit = Audit(app.pk, app.pk.requestor)
 
@@ -121,7 +124,7 @@ def test_patient_id(app, patient_generator):
     audit = Audit(app.pk, app.pk.requestor)
 
     patient1 = patient_generator([
-        "./data/Becker^Matthew/HNC0522c0009_Plan1.dcm",
+        os.path.join(BECKER_PATH, "HNC0522c0009_Plan1.dcm"),
     ])
     patient2 = patient_generator([
         "./data/Jensen^Myrtle/HNC0522c0013_CT1_image00000.dcm",
@@ -137,7 +140,7 @@ def test_patient_mrn(app, patient_generator):
     audit = Audit(app.pk, app.pk.requestor)
 
     patient1 = patient_generator([
-        "./data/Becker^Matthew/HNC0522c0009_Plan1.dcm",
+        os.path.join(BECKER_PATH, "HNC0522c0009_Plan1.dcm"),
     ])
     patient2 = patient_generator([
         "./data/Jensen^Myrtle/HNC0522c0013_CT1_image00000.dcm",
@@ -259,7 +262,7 @@ def test_text(app, user_generator, workspace_generator, patient_generator):
     audit = Audit(app.pk, app.pk.requestor)
 
     patient = patient_generator([
-        "./data/Becker^Matthew/HNC0522c0009_Plan1.dcm",
+        os.path.join(BECKER_PATH, "HNC0522c0009_Plan1.dcm"),
     ])
     user_generator()
     workspace_generator()
@@ -3,11 +3,23 @@ import os
 
 from proknow import ProKnow, Exceptions
 
+BECKER_PATH = os.path.abspath("./data/Becker^Matthew")
+
 def test_get_binary(app, entity_generator, temp_directory):
     pk = app.pk
 
-    dose_path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_Plan1_Dose.dcm")
+    dose_path = os.path.join(BECKER_PATH, "HNC0522c0009_Plan1_Dose.dcm")
     dose = entity_generator(dose_path)
     
     _, content = pk.requestor.get_binary('/workspaces/' + dose.workspace_id + '/doses/' + dose.id + '/dicom')
     assert isinstance(content, bytes)
+
+def test_connection_pool(app):
+    pk = app.pk
+
+    # Every request to the API goes through the same pooled, retrying adapter
+    session = pk.requestor._session
+    adapter = session.get_adapter(pk.requestor._base_url)
+    assert adapter is session.get_adapter('http://') is session.get_adapter('https://')
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 16
+    assert adapter.max_retries.total == 3
@@ -1,35 +1,25 @@
 import pytest
-import filecmp
 import os
 
 from proknow import ProKnow, Exceptions
 
-def test_download(app, entity_generator, temp_directory):
-    pk = app.pk
-
-    dose_path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_Plan1_Dose.dcm")
-    dose = entity_generator(dose_path)
+BECKER_PATH = os.path.abspath("./data/Becker^Matthew")
+STRUCTURE_SET_PATH = os.path.join(BECKER_PATH, "HNC0522c0009_StrctrSets.dcm")
+PLAN_PATH = os.path.join(BECKER_PATH, "HNC0522c0009_Plan1.dcm")
+DOSE_PATH = os.path.join(BECKER_PATH, "HNC0522c0009_Plan1_Dose.dcm")
 
-    # Download to directory
-    download_path = dose.download(temp_directory.path)
-    assert filecmp.cmp(dose_path, download_path, shallow=False)
+def test_download(app, readonly_entity_generator, download_checker):
+    dose = readonly_entity_generator(DOSE_PATH)
 
-    # Download to specific file
-    specific_path = os.path.join(temp_directory.path, "dose.dcm")
-    download_path = dose.download(specific_path)
-    assert specific_path == download_path
-    assert filecmp.cmp(dose_path, download_path, shallow=False)
+    download_checker(dose, DOSE_PATH, "dose.dcm")
 
     # File does not exist
     with pytest.raises(Exceptions.InvalidPathError) as err_wrapper:
-        download_path = dose.download("/path/to/nowhere/dose.dcm")
+        dose.download("/path/to/nowhere/dose.dcm")
     assert err_wrapper.value.message == "`/path/to/nowhere/dose.dcm` is invalid"
 
 def test_get_slice_data(app, entity_generator):
-    pk = app.pk
-
-    dose_path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_Plan1_Dose.dcm")
-    dose = entity_generator(dose_path)
+    dose = entity_generator(DOSE_PATH)
 
     data = dose.get_slice_data(0)
     assert isinstance(data, bytes), "data is not binary"
@@ -37,11 +27,9 @@ def test_get_slice_data(app, entity_generator):
 def test_get_analysis(app, workspace_generator):
     pk = app.pk
 
-    directory = os.path.abspath("./data/Becker^Matthew/")
-    dose_path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_Plan1_Dose.dcm")
     _, workspace = workspace_generator()
-    batch = pk.uploads.upload(workspace.id, directory)
-    dose = batch.find_entity(dose_path).get();
+    batch = pk.uploads.upload(workspace.id, BECKER_PATH)
+    dose = batch.find_entity(DOSE_PATH).get();
 
     analysis = dose.get_analysis()
     assert isinstance(analysis["max_dose"], (float,int))
@@ -76,22 +64,17 @@ def test_get_analysis(app, workspace_generator):
             assert len(point) == 2
 
 def test_get_analysis_failure(app, entity_generator):
-    pk = app.pk
-
-    dose_path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_Plan1_Dose.dcm")
-    dose = entity_generator(dose_path)
+    dose = entity_generator(DOSE_PATH)
 
     with pytest.raises(AssertionError) as err_wrapper:
         dose.get_analysis()
     assert str(err_wrapper.value) == "Dose analysis not possible"
 
 def test_refresh(app, patient_generator):
-    pk = app.pk
-
     patient = patient_generator([
-        "./data/Becker^Matthew/HNC0522c0009_StrctrSets.dcm",
-        "./data/Becker^Matthew/HNC0522c0009_Plan1.dcm",
-        "./data/Becker^Matthew/HNC0522c0009_Plan1_Dose.dcm"
+        STRUCTURE_SET_PATH,
+        PLAN_PATH,
+        DOSE_PATH
     ])
     dose = patient.find_entities(type="dose")[0].get()
     plan = patient.find_entities(type="plan")[0]
@@ -101,12 +84,10 @@ def test_refresh(app, patient_generator):
     assert dose.data != old_data
 
 def test_metrics_add(app, patient_generator):
-    pk = app.pk
-
     patient = patient_generator([
-        "./data/Becker^Matthew/HNC0522c0009_StrctrSets.dcm",
-        "./data/Becker^Matthew/HNC0522c0009_Plan1.dcm",
-        "./data/Becker^Matthew/HNC0522c0009_Plan1_Dose.dcm"
+        STRUCTURE_SET_PATH,
+        PLAN_PATH,
+        DOSE_PATH
     ])
 
     dose = patient.find_entities(type="dose")[0].get()
@@ -127,12 +108,10 @@ def test_metrics_add(app, patient_generator):
     assert len(metrics) == 2
 
 def test_metrics_add_failure(app, patient_generator):
-    pk = app.pk
-
     patient = patient_generator([
-        "./data/Becker^Matthew/HNC0522c0009_StrctrSets.dcm",
-        "./data/Becker^Matthew/HNC0522c0009_Plan1.dcm",
-        "./data/Becker^Matthew/HNC0522c0009_Plan1_Dose.dcm"
+        STRUCTURE_SET_PATH,
+        PLAN_PATH,
+        DOSE_PATH
     ])
 
     dose = patient.find_entities(type="dose")[0].get()
@@ -147,12 +126,10 @@ def test_metrics_add_failure(app, patient_generator):
     assert err_wrapper.value.body == '"value" must be an array'
 
 def test_metrics_query(app, patient_generator):
-    pk = app.pk
-
     patient = patient_generator([
-        "./data/Becker^Matthew/HNC0522c0009_StrctrSets.dcm",
-        "./data/Becker^Matthew/HNC0522c0009_Plan1.dcm",
-        "./data/Becker^Matthew/HNC0522c0009_Plan1_Dose.dcm"
+        STRUCTURE_SET_PATH,
+        PLAN_PATH,
+        DOSE_PATH
     ])
 
     dose = patient.find_entities(type="dose")[0].get()
@@ -1,48 +1,48 @@
 import pytest
-import filecmp
 import os
+import re
 
 from proknow import ProKnow, Exceptions
 
-def test_download(app, entity_generator, temp_directory):
-    pk = app.pk
+BECKER_PATH = os.path.abspath("./data/Becker^Matthew")
 
+def test_download(app, readonly_entity_generator, temp_directory):
     image_files = [
-        os.path.abspath("./data/Becker^Matthew/HNC0522c0009_CT1_image00000.dcm"),
-        os.path.abspath("./data/Becker^Matthew/HNC0522c0009_CT1_image00001.dcm"),
-        os.path.abspath("./data/Becker^Matthew/HNC0522c0009_CT1_image00002.dcm"),
-        os.path.abspath("./data/Becker^Matthew/HNC0522c0009_CT1_image00003.dcm"),
-        os.path.abspath("./data/Becker^Matthew/HNC0522c0009_CT1_image00004.dcm"),
+        os.path.join(BECKER_PATH, "HNC0522c0009_CT1_image00000.dcm"),
+        os.path.join(BECKER_PATH, "HNC0522c0009_CT1_image00001.dcm"),
+        os.path.join(BECKER_PATH, "HNC0522c0009_CT1_image00002.dcm"),
+        os.path.join(BECKER_PATH, "HNC0522c0009_CT1_image00003.dcm"),
+        os.path.join(BECKER_PATH, "HNC0522c0009_CT1_image00004.dcm"),
     ]
-    image_set = entity_generator(image_files)
+    image_set = readonly_entity_generator(image_files)
 
-    # Download to directory
-    download_path = image_set.download(temp_directory.path)
-    download_image_paths = []
-    for _, _, paths in os.walk(download_path):
-        for path in paths:
-            download_image_paths.append(os.path.join(download_path, path))
+    sources = []
     for image_file in image_files:
-        for download_image_path in download_image_paths:
-            if filecmp.cmp(image_file, download_image_path, shallow=False):
-                found = True
-                break
-        else:
-            found = False
-        assert found
+        with open(image_file, 'rb') as file:
+            sources.append(file.read())
+
+    # Download to directory. Each image is saved as <modality>.<SOP Instance UID> and must match the
+    # one source file that holds that UID.
+    download_path = image_set.download(temp_directory.path)
+    images = image_set.data["data"]["images"]
+    assert len(os.listdir(download_path)) == len(images) == len(image_files)
+    for image in images:
+        # The lookahead keeps a UID from matching the start of a longer one
+        uid = re.compile(re.escape(image["uid"].encode()) + rb"(?![0-9.])")
+        source, = [data for data in sources if uid.search(data)]
+        with open(os.path.join(download_path, image_set.data["modality"] + "." + image["uid"]), 'rb') as file:
+            assert file.read() == source
 
     # Directory does not exist
     with pytest.raises(Exceptions.InvalidPathError) as err_wrapper:
         download_path = image_set.download("/path/to/nowhere/")
     assert err_wrapper.value.message == "`/path/to/nowhere/` is invalid"
 
-def test_get_image_data(app, entity_generator):
-    pk = app.pk
-
+def test_get_image_data(app, readonly_entity_generator):
     image_files = [
-        os.path.abspath("./data/Becker^Matthew/HNC0522c0009_CT1_image00000.dcm"),
+        os.path.join(BECKER_PATH, "HNC0522c0009_CT1_image00000.dcm"),
     ]
-    image_set = entity_generator(image_files)
+    image_set = readonly_entity_generator(image_files)
 
     data = image_set.get_image_data(0)
     assert isinstance(data, bytes), "data is not binary"
@@ -51,12 +51,12 @@ def test_get_refresh(app, entity_generator):
     pk = app.pk
 
     image_files = [
-        os.path.abspath("./data/Becker^Matthew/HNC0522c0009_CT1_image00000.dcm"),
+        os.path.join(BECKER_PATH, "HNC0522c0009_CT1_image00000.dcm"),
     ]
     image_set = entity_generator(image_files)
 
     old_data = image_set.data
-    pk.uploads.upload(image_set._workspace_id, os.path.abspath("./data/Becker^Matthew/HNC0522c0009_CT1_image00001.dcm"))
+    pk.uploads.upload(image_set._workspace_id, os.path.join(BECKER_PATH, "HNC0522c0009_CT1_image00001.dcm"))
 
     image_set.refresh()
     assert image_set.data != old_data
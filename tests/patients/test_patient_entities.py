@@ -1,77 +1,78 @@
 import pytest
 import re
 import os
-import filecmp
 
 from proknow import Exceptions
 
+BECKER_PATH = os.path.abspath("./data/Becker^Matthew")
+
 def test_delete_entity_summary(app, workspace_generator):
     pk = app.pk
 
-    directory = os.path.abspath("./data/Becker^Matthew/")
+    directory = BECKER_PATH
     _, workspace = workspace_generator()
     batch = pk.uploads.upload(workspace.id, directory)
     assert len(batch.patients) == 1
     patient_id = batch.patients[0].id
 
     patient = pk.patients.get(workspace.id, patient_id)
-    assert len(patient.find_entities(lambda entity: True)) == 4
+    assert len(patient.list_entities()) == 4
     image_set = patient.find_entities(type="image_set")[0]
     image_set.delete()
     patient = pk.patients.get(workspace.id, patient_id)
-    assert len(patient.find_entities(lambda entity: True)) == 3
+    assert len(patient.list_entities()) == 3
     assert len(patient.find_entities(type="image_set")) == 0
 
     structure_set = patient.find_entities(type="structure_set")[0]
     structure_set.delete()
     patient = pk.patients.get(workspace.id, patient_id)
-    assert len(patient.find_entities(lambda entity: True)) == 2
+    assert len(patient.list_entities()) == 2
     assert len(patient.find_entities(type="structure_set")) == 0
 
     plan = patient.find_entities(type="plan")[0]
     plan.delete()
     patient = pk.patients.get(workspace.id, patient_id)
-    assert len(patient.find_entities(lambda entity: True)) == 1
+    assert len(patient.list_entities()) == 1
     assert len(patient.find_entities(type="plan")) == 0
 
     dose = patient.find_entities(type="dose")[0]
     dose.delete()
     patient = pk.patients.get(workspace.id, patient_id)
-    assert len(patient.find_entities(lambda entity: True)) == 0
+    assert len(patient.list_entities()) == 0
 
 def test_delete_entity_item(app, workspace_generator):
     pk = app.pk
 
-    directory = os.path.abspath("./data/Becker^Matthew/")
+    directory = BECKER_PATH
     _, workspace = workspace_generator()
     batch = pk.uploads.upload(workspace.id, directory)
     assert len(batch.patients) == 1
     patient_id = batch.patients[0].id
 
     patient = pk.patients.get(workspace.id, patient_id)
-    assert len(patient.find_entities(lambda entity: True)) == 4
+    assert len(patient.list_entities()) == 4
     image_set = patient.find_entities(type="image_set")[0]
     image_set.get().delete()
     patient = pk.patients.get(workspace.id, patient_id)
-    assert len(patient.find_entities(lambda entity: True)) == 3
+    assert len(patient.list_entities()) == 3
     assert len(patient.find_entities(type="image_set")) == 0
 
     structure_set = patient.find_entities(type="structure_set")[0]
     structure_set.get().delete()
     patient = pk.patients.get(workspace.id, patient_id)
-    assert len(patient.find_entities(lambda entity: True)) == 2
+    assert len(patient.list_entities()) == 2
     assert len(patient.find_entities(type="structure_set")) == 0
 
     plan = patient.find_entities(type="plan")[0]
     plan.get().delete()
     patient = pk.patients.get(workspace.id, patient_id)
-    assert len(patient.find_entities(lambda entity: True)) == 1
+    assert len(patient.list_entities()) == 1
     assert len(patient.find_entities(type="plan")) == 0
 
     dose = patient.find_entities(type="dose")[0]
     dose.get().delete()
     patient = pk.patients.get(workspace.id, patient_id)
-    assert len(patient.find_entities(lambda entity: True)) == 0
+    assert len(patient.list_entities()) == 0
 
 def test_update(app, entity_generator, custom_metric_generator):
     pk = app.pk
@@ -80,10 +81,10 @@ def test_update(app, entity_generator, custom_metric_generator):
     _, custom_metric_structure_set = custom_metric_generator(context="structure_set", type={"number": {}})
     _, custom_metric_plan = custom_metric_generator(context="plan", type={"number": {}})
     _, custom_metric_dose = custom_metric_generator(context="dose", type={"number": {}})
-    image_set_path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_CT1_image00000.dcm")
-    structure_set_path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_StrctrSets.dcm")
-    plan_path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_Plan1.dcm")
-    dose_path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_Plan1_Dose.dcm")
+    image_set_path = os.path.join(BECKER_PATH, "HNC0522c0009_CT1_image00000.dcm")
+    structure_set_path = os.path.join(BECKER_PATH, "HNC0522c0009_StrctrSets.dcm")
+    plan_path = os.path.join(BECKER_PATH, "HNC0522c0009_Plan1.dcm")
+    dose_path = os.path.join(BECKER_PATH, "HNC0522c0009_Plan1_Dose.dcm")
     image_set = entity_generator(image_set_path)
     structure_set = entity_generator(structure_set_path)
     plan = entity_generator(plan_path)
@@ -142,9 +143,7 @@ def test_update(app, entity_generator, custom_metric_generator):
     }
 
 def test_update_failure(app, entity_generator):
-    pk = app.pk
-
-    image_set_path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_CT1_image00000.dcm")
+    image_set_path = os.path.join(BECKER_PATH, "HNC0522c0009_CT1_image00000.dcm")
     image_set = entity_generator(image_set_path)
     image_set.delete()
 
@@ -155,9 +154,7 @@ def test_update_failure(app, entity_generator):
     assert err_wrapper.value.body ==  '{"type":"ENTITY_NOT_FOUND","params":{"entity_id":"' + image_set.id + '","workspace_id":"' + image_set.workspace_id + '"},"message":"Entity \\"' + image_set.id + '\\" not found in workspace \\"' + image_set.workspace_id + '\\""}'
 
 def test_set_metadata_failure(app, entity_generator):
-    pk = app.pk
-
-    image_set_path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_CT1_image00000.dcm")
+    image_set_path = os.path.join(BECKER_PATH, "HNC0522c0009_CT1_image00000.dcm")
     image_set = entity_generator(image_set_path)
     meta = image_set.get_metadata()
     meta["Unknown Metric"] = "test"
@@ -167,11 +164,9 @@ def test_set_metadata_failure(app, entity_generator):
     assert err_wrapper.value.message == 'Custom metric with name `Unknown Metric` not found.'
 
 def test_update_parent(app, patient_generator):
-    pk = app.pk
-
-    dose_path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_Plan1_Dose.dcm")
-    image_set_path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_CT1_image00000.dcm")
-    structure_set_path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_StrctrSets.dcm")
+    dose_path = os.path.join(BECKER_PATH, "HNC0522c0009_Plan1_Dose.dcm")
+    image_set_path = os.path.join(BECKER_PATH, "HNC0522c0009_CT1_image00000.dcm")
+    structure_set_path = os.path.join(BECKER_PATH, "HNC0522c0009_StrctrSets.dcm")
     patient = patient_generator([image_set_path, structure_set_path, dose_path])
     dose = patient.find_entities(type="dose")[0].get()
     image_set = patient.find_entities(type="image_set")[0].get()
@@ -195,10 +190,8 @@ def test_update_parent(app, patient_generator):
     }
 
 def test_update_parent_failure(app, patient_generator):
-    pk = app.pk
-
-    dose_path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_Plan1_Dose.dcm")
-    structure_set_path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_StrctrSets.dcm")
+    dose_path = os.path.join(BECKER_PATH, "HNC0522c0009_Plan1_Dose.dcm")
+    structure_set_path = os.path.join(BECKER_PATH, "HNC0522c0009_StrctrSets.dcm")
     patient = patient_generator([structure_set_path, dose_path])
     dose = patient.find_entities(type="dose")[0].get()
     structure_set = patient.find_entities(type="structure_set")[0].get()
@@ -3,7 +3,10 @@ import re
 
 from proknow import Exceptions
 
-def test_create(app, workspace_generator, custom_metric_generator):
+FIND_EXPR = re.compile(r"nd Score")
+LOWER_EXPR = re.compile(r"score")
+
+def test_create(app, workspace_generator, custom_metric_generator, make_computed):
     pk = app.pk
 
     _, custom_metric = custom_metric_generator()
@@ -16,37 +19,7 @@ def test_create(app, workspace_generator, custom_metric_generator):
     assert len(scorecard.custom) == 0
     assert isinstance(scorecard.data, dict)
 
-    scorecard = patient.scorecards.create("My Scorecard 2", [{
-        "type": "VOLUME",
-        "roi_name": "BRAINSTEM",
-        "arg_1": None,
-        "arg_2": None
-    }, {
-        "type": "VOLUME_CC_DOSE_RANGE_ROI",
-        "roi_name": "BRAINSTEM",
-        "arg_1": 30,
-        "arg_2": 60,
-        "objectives": [{
-            "label": "IDEAL",
-            "color": [18, 191, 0],
-            "max": 0
-        }, {
-            "label": "GOOD",
-            "color": [136, 223, 127],
-            "max": 3
-        }, {
-            "label": "ACCEPTABLE",
-            "color": [255, 216, 0],
-            "max": 6
-        }, {
-            "label": "MARGINAL",
-            "color": [255, 102, 0],
-            "max": 9
-        }, {
-            "label": "UNACCEPTABLE",
-            "color": [255, 0, 0]
-        }]
-    }], [{
+    scorecard = patient.scorecards.create("My Scorecard 2", make_computed(), [{
         "id": custom_metric.id
     }])
     assert scorecard.name == "My Scorecard 2"
@@ -74,12 +47,8 @@ def test_delete(app, workspace_generator):
 
     # Verify scorecard was deleted successfully
     scorecard.delete()
-    for scorecard in patient.scorecards.query():
-        if scorecard.name == "My Scorecard":
-            match = scorecard
-            break
-    else:
-        match = None
+    scorecards = {scorecard.name: scorecard for scorecard in patient.scorecards.query()}
+    match = scorecards.get("My Scorecard")
     assert match is None
 
 def test_delete_failure(app, workspace_generator):
@@ -102,15 +71,13 @@ def test_find(app, workspace_generator):
     _, workspace = workspace_generator()
     patient = pk.patients.create(workspace.id, "1000", "Last^First")
     scorecard = patient.scorecards.create("Find Scorecards Test", [], [])
-    expr = re.compile(r"nd Score")
-    expr2 = re.compile(r"score")
 
     # Find with no args
     found = patient.scorecards.find()
     assert found is None
 
     # Find using predicate
-    found = patient.scorecards.find(lambda p: expr.search(p.data["name"]) is not None)
+    found = patient.scorecards.find(lambda p: FIND_EXPR.search(p.data["name"]) is not None)
     assert found is not None
     assert found.name == "Find Scorecards Test"
     scorecard = found.get()
@@ -126,7 +93,7 @@ def test_find(app, workspace_generator):
     assert len(scorecard.custom) == 0
 
     # Find using both
-    found = patient.scorecards.find(lambda p: expr.search(p.data["name"]) is not None, name="Find Scorecards Test")
+    found = patient.scorecards.find(lambda p: FIND_EXPR.search(p.data["name"]) is not None, name="Find Scorecards Test")
     assert found is not None
     assert found.name == "Find Scorecards Test"
     scorecard = found.get()
@@ -134,7 +101,7 @@ def test_find(app, workspace_generator):
     assert len(scorecard.custom) == 0
 
     # Find failure
-    found = patient.scorecards.find(lambda p: expr2.search(p.data["name"]) is not None)
+    found = patient.scorecards.find(lambda p: LOWER_EXPR.search(p.data["name"]) is not None)
     assert found is None
     found = patient.scorecards.find(name="Find Scorecards")
     assert found is None
@@ -144,32 +111,24 @@ def test_query(app, workspace_generator):
 
     _, workspace = workspace_generator()
     patient = pk.patients.create(workspace.id, "1000", "Last^First")
-    scorecard = patient.scorecards.create("My Scorecard 1", [], [])
-    scorecard = patient.scorecards.create("My Scorecard 2", [], [])
+    patient.scorecards.create("My Scorecard 1", [], [])
+    patient.scorecards.create("My Scorecard 2", [], [])
+
+    scorecards = {scorecard.name: scorecard for scorecard in patient.scorecards.query()}
 
     # Verify scorecard 1
-    for scorecard in patient.scorecards.query():
-        if scorecard.name == "My Scorecard 1":
-            match = scorecard
-            break
-    else:
-        match = None
-    assert scorecard is not None
-    assert isinstance(scorecard.id, str)
-    assert scorecard.name == "My Scorecard 1"
+    match = scorecards.get("My Scorecard 1")
+    assert match is not None
+    assert isinstance(match.id, str)
+    assert match.name == "My Scorecard 1"
 
     # Verify scorecard 2
-    for scorecard in patient.scorecards.query():
-        if scorecard.name == "My Scorecard 2":
-            match = scorecard
-            break
-    else:
-        match = None
-    assert scorecard is not None
-    assert isinstance(scorecard.id, str)
-    assert scorecard.name == "My Scorecard 2"
+    match = scorecards.get("My Scorecard 2")
+    assert match is not None
+    assert isinstance(match.id, str)
+    assert match.name == "My Scorecard 2"
 
-def test_update(app, workspace_generator, custom_metric_generator):
+def test_update(app, workspace_generator, custom_metric_generator, make_computed):
     pk = app.pk
 
     _, custom_metric = custom_metric_generator()
@@ -179,48 +138,13 @@ def test_update(app, workspace_generator, custom_metric_generator):
 
     # Verify patient scorecard was updated successfully
     scorecard.name = "My Scorecard Updated"
-    scorecard.computed = [{
-        "type": "VOLUME",
-        "roi_name": "BRAINSTEM",
-        "arg_1": None,
-        "arg_2": None
-    }, {
-        "type": "VOLUME_CC_DOSE_RANGE_ROI",
-        "roi_name": "BRAINSTEM",
-        "arg_1": 30,
-        "arg_2": 60,
-        "objectives": [{
-            "label": "IDEAL",
-            "color": [18, 191, 0],
-            "max": 0
-        }, {
-            "label": "GOOD",
-            "color": [136, 223, 127],
-            "max": 3
-        }, {
-            "label": "ACCEPTABLE",
-            "color": [255, 216, 0],
-            "max": 6
-        }, {
-            "label": "MARGINAL",
-            "color": [255, 102, 0],
-            "max": 9
-        }, {
-            "label": "UNACCEPTABLE",
-            "color": [255, 0, 0]
-        }]
-    }]
+    scorecard.computed = make_computed()
     scorecard.custom = [{
         "id": custom_metric.id
     }]
     scorecard.save()
-    scorecards = patient.scorecards.query()
-    for scorecard in scorecards:
-        if scorecard.name == "My Scorecard Updated":
-            scorecard_match = scorecard
-            break
-    else:
-        scorecard_match = None
+    scorecards = {scorecard.name: scorecard for scorecard in patient.scorecards.query()}
+    scorecard_match = scorecards.get("My Scorecard Updated")
     assert scorecard_match is not None
     scorecard_item = scorecard_match.get()
     assert scorecard_item.name == "My Scorecard Updated"
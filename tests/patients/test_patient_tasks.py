@@ -1,11 +1,14 @@
 import pytest
+import os
 
 from proknow import Exceptions
 
+BECKER_PATH = os.path.abspath("./data/Becker^Matthew")
+
 def test_create(app, patient_generator):
     pk = app.pk
 
-    patient = patient_generator("./data/Becker^Matthew")
+    patient = patient_generator(BECKER_PATH)
     dose = patient.find_entities(type="dose")[0]
     operands = [{
         "type": "dose",
@@ -32,9 +35,7 @@ def test_create(app, patient_generator):
     assert len(doses) == 1
 
 def test_delete(app, patient_generator):
-    pk = app.pk
-
-    patient = patient_generator("./data/Becker^Matthew")
+    patient = patient_generator(BECKER_PATH)
     dose = patient.find_entities(type="dose")[0]
     operands = [{
         "type": "dose",
@@ -59,9 +60,7 @@ def test_delete(app, patient_generator):
     assert task.data["hidden"] is True
 
 def test_get(app, patient_generator):
-    pk = app.pk
-
-    patient = patient_generator("./data/Becker^Matthew")
+    patient = patient_generator(BECKER_PATH)
     dose = patient.find_entities(type="dose")[0]
     operands = [{
         "type": "dose",
@@ -101,9 +100,7 @@ def test_get(app, patient_generator):
     assert "output" in item.data
 
 def test_query(app, patient_generator):
-    pk = app.pk
-
-    patient = patient_generator("./data/Becker^Matthew")
+    patient = patient_generator(BECKER_PATH)
     dose = patient.find_entities(type="dose")[0]
     operands = [{
         "type": "dose",
@@ -1,10 +1,26 @@
 import pytest
 import re
 import os
-import filecmp
 
 from proknow import Exceptions
 
+BECKER_PATH = os.path.abspath("./data/Becker^Matthew")
+
+NAME_EXPR = re.compile(r"st\^Fi")
+
+def assert_demographics(patient, mrn, name, birth_date=None, sex=None):
+    assert (patient.mrn, patient.name, patient.birth_date, patient.sex) == (mrn, name, birth_date, sex)
+
+@pytest.fixture(scope="module")
+def becker_patient(app, module_workspace_generator):
+    # One upload of Becker^Matthew for the tests that only read the patient and its entities
+    _, workspace = module_workspace_generator()
+    batch = app.pk.uploads.upload(workspace.id, BECKER_PATH)
+    return batch.patients[0].get()
+
+def name_matches(patient):
+    return NAME_EXPR.search(patient.data["name"]) is not None
+
 def test_create(app, workspace_generator):
     pk = app.pk
 
@@ -13,25 +29,14 @@ def test_create(app, workspace_generator):
     # Verify returned PatientItem
     patient = pk.patients.create(workspace.id, "1000", "Last^First", "2018-01-01", "M")
     assert patient.workspace_id == workspace.id
-    assert patient.mrn == "1000"
-    assert patient.name == "Last^First"
-    assert patient.birth_date == "2018-01-01"
-    assert patient.sex == "M"
+    assert_demographics(patient, "1000", "Last^First", "2018-01-01", "M")
 
     # Assert item can be found in query
-    patients = pk.patients.query(workspace.id)
-    for patient in patients:
-        if patient.mrn == "1000":
-            patient_match = patient
-            break
-    else:
-        patient_match = None
+    patients = {patient.mrn: patient for patient in pk.patients.query(workspace.id)}
+    patient_match = patients.get("1000")
     assert patient_match is not None
     assert patient_match.workspace_id == workspace.id
-    assert patient_match.mrn == "1000"
-    assert patient_match.name == "Last^First"
-    assert patient_match.birth_date == "2018-01-01"
-    assert patient_match.sex == "M"
+    assert_demographics(patient_match, "1000", "Last^First", "2018-01-01", "M")
 
 def test_create_failure(app, workspace_generator):
     pk = app.pk
@@ -45,10 +50,46 @@ def test_create_failure(app, workspace_generator):
     assert err_wrapper.value.status_code == 409
     assert err_wrapper.value.body == 'Patient already exists with mrn "1000"'
 
-def test_create_structure_set(app, patient_generator):
+def test_create_many(app, workspace_generator):
     pk = app.pk
 
-    patient = patient_generator("./data/Becker^Matthew")
+    _, workspace = workspace_generator()
+
+    # Verify returned PatientItems are in input order
+    patients = pk.patients.create_many(workspace.id, [
+        {"mrn": "1000", "name": "Test^1", "birth_date": "2018-01-01", "sex": "M"},
+        {"mrn": "1001", "name": "Test^2"},
+    ])
+    assert len(patients) == 2
+    assert_demographics(patients[0], "1000", "Test^1", "2018-01-01", "M")
+    assert_demographics(patients[1], "1001", "Test^2")
+
+    # Assert items can be found in query
+    assert len(pk.patients.query(workspace.id)) == 2
+
+def test_create_many_failure(app, workspace_generator):
+    pk = app.pk
+
+    _, workspace = workspace_generator()
+
+    # Assert error is raised for duplicate patient
+    with pytest.raises(Exceptions.HttpError) as err_wrapper:
+        pk.patients.create_many(workspace.id, [
+            {"mrn": "1000", "name": "Last^First"},
+            {"mrn": "1000", "name": "Last^First"},
+        ])
+    assert err_wrapper.value.status_code == 409
+    assert err_wrapper.value.body == 'Patient already exists with mrn "1000"'
+
+    # Assert each patient is validated like create
+    with pytest.raises(AssertionError) as err_wrapper:
+        pk.patients.create_many(workspace.id, [
+            {"mrn": "1001", "name": "Last^First", "sex": 1},
+        ])
+    assert str(err_wrapper.value) == "`sex` is required as a string."
+
+def test_create_structure_set(app, patient_generator):
+    patient = patient_generator(BECKER_PATH)
 
     image_set = patient.find_entities(type="image_set")[0]
     structure_set = patient.create_structure_set("My Structure Set", image_set.id)
@@ -61,16 +102,14 @@ def test_create_structure_set(app, patient_generator):
     assert len(structure_sets) == 1
 
 def test_create_plan(app, patient_generator):
-    pk = app.pk
-
     patient = patient_generator([
-        "./data/Becker^Matthew/HNC0522c0009_CT1_image00000.dcm",
-        "./data/Becker^Matthew/HNC0522c0009_CT1_image00001.dcm",
-        "./data/Becker^Matthew/HNC0522c0009_CT1_image00002.dcm",
-        "./data/Becker^Matthew/HNC0522c0009_CT1_image00003.dcm",
-        "./data/Becker^Matthew/HNC0522c0009_CT1_image00004.dcm",
-        "./data/Becker^Matthew/HNC0522c0009_Plan1_Dose.dcm",
-        "./data/Becker^Matthew/HNC0522c0009_StrctrSets.dcm",
+        os.path.join(BECKER_PATH, "HNC0522c0009_CT1_image00000.dcm"),
+        os.path.join(BECKER_PATH, "HNC0522c0009_CT1_image00001.dcm"),
+        os.path.join(BECKER_PATH, "HNC0522c0009_CT1_image00002.dcm"),
+        os.path.join(BECKER_PATH, "HNC0522c0009_CT1_image00003.dcm"),
+        os.path.join(BECKER_PATH, "HNC0522c0009_CT1_image00004.dcm"),
+        os.path.join(BECKER_PATH, "HNC0522c0009_Plan1_Dose.dcm"),
+        os.path.join(BECKER_PATH, "HNC0522c0009_StrctrSets.dcm"),
     ])
 
     image_set = patient.find_entities(type="image_set")[0]
@@ -127,13 +166,8 @@ def test_delete(app, workspace_generator):
 
     # Verify patient was deleted successfully
     patient.delete()
-    for patient in pk.patients.query(workspace.id):
-        if patient.mrn == "1000":
-            match = patient
-            break
-    else:
-        match = None
-    assert match is None
+    patients = {patient.mrn: patient for patient in pk.patients.query(workspace.id)}
+    assert "1000" not in patients
 
 def test_delete_failure(app, workspace_generator):
     pk = app.pk
@@ -154,38 +188,28 @@ def test_find(app, workspace_generator):
 
     _, workspace = workspace_generator()
     pk.patients.create(workspace.id, "1000", "Last^First")
-    expr = re.compile(r"st\^Fi")
 
     # Find with no args
     found = pk.patients.find(workspace.id)
     assert found is None
 
     # Find using predicate
-    found = pk.patients.find(workspace.id, lambda p: expr.search(p.data["name"]) is not None)
+    found = pk.patients.find(workspace.id, name_matches)
     assert found is not None
-    assert found.mrn == "1000"
-    assert found.name == "Last^First"
-    assert found.birth_date == None
-    assert found.sex == None
+    assert_demographics(found, "1000", "Last^First")
 
     # Find using props
     found = pk.patients.find(workspace.id, mrn="1000", name="Last^First")
     assert found is not None
-    assert found.mrn == "1000"
-    assert found.name == "Last^First"
-    assert found.birth_date == None
-    assert found.sex == None
+    assert_demographics(found, "1000", "Last^First")
 
     # Find using both
-    found = pk.patients.find(workspace.id, lambda p: expr.search(p.data["name"]) is not None, mrn="1000", name="Last^First")
+    found = pk.patients.find(workspace.id, name_matches, mrn="1000", name="Last^First")
     assert found is not None
-    assert found.mrn == "1000"
-    assert found.name == "Last^First"
-    assert found.birth_date == None
-    assert found.sex == None
+    assert_demographics(found, "1000", "Last^First")
 
     # Find failure
-    found = pk.patients.find(workspace.id, lambda p: expr.search(p.data["mrn"]) is not None)
+    found = pk.patients.find(workspace.id, lambda p: NAME_EXPR.search(p.data["mrn"]) is not None)
     assert found is None
     found = pk.patients.find(workspace.id, mrn="1000", name="last^first")
     assert found is None
@@ -194,8 +218,10 @@ def test_lookup(app, workspace_generator):
     pk = app.pk
 
     _, workspace = workspace_generator()
-    pk.patients.create(workspace.id, "1000", "Test^1", "2018-01-01", "M")
-    pk.patients.create(workspace.id, "1001", "Test^2")
+    pk.patients.create_many(workspace.id, [
+        {"mrn": "1000", "name": "Test^1", "birth_date": "2018-01-01", "sex": "M"},
+        {"mrn": "1001", "name": "Test^2"},
+    ])
 
     patients = pk.patients.lookup(workspace.id, ["1000", "1001", "invalid"])
     assert len(patients) == 3
@@ -205,15 +231,9 @@ def test_lookup(app, workspace_generator):
             assert i == 2
         else:
             if patient.mrn == "1000":
-                assert patient.mrn == "1000"
-                assert patient.name == "Test^1"
-                assert patient.birth_date == "2018-01-01"
-                assert patient.sex == "M"
+                assert_demographics(patient, "1000", "Test^1", "2018-01-01", "M")
             elif patient.mrn == "1001":
-                assert patient.mrn == "1001"
-                assert patient.name == "Test^2"
-                assert patient.birth_date == None
-                assert patient.sex == None
+                assert_demographics(patient, "1001", "Test^2")
         i += 1
 
 def test_query(app, workspace_generator):
@@ -221,36 +241,24 @@ def test_query(app, workspace_generator):
 
     _, workspace = workspace_generator()
 
-    pk.patients.create(workspace.id, "1000", "Test^1", "2018-01-01", "M")
-    pk.patients.create(workspace.id, "1001", "Test^2")
+    pk.patients.create_many(workspace.id, [
+        {"mrn": "1000", "name": "Test^1", "birth_date": "2018-01-01", "sex": "M"},
+        {"mrn": "1001", "name": "Test^2"},
+    ])
+
+    patients = {patient.mrn: patient for patient in pk.patients.query(workspace.id)}
 
     # Verify test 1
-    for patient in pk.patients.query(workspace.id):
-        if patient.mrn == "1000":
-            match = patient
-            break
-    else:
-        match = None
+    match = patients.get("1000")
     assert match is not None
     assert isinstance(match.id, str)
-    assert match.mrn == "1000"
-    assert match.name == "Test^1"
-    assert match.birth_date == "2018-01-01"
-    assert match.sex == "M"
+    assert_demographics(match, "1000", "Test^1", "2018-01-01", "M")
 
     # Verify test 2
-    for patient in pk.patients.query(workspace.id):
-        if patient.mrn == "1001":
-            match = patient
-            break
-    else:
-        match = None
+    match = patients.get("1001")
     assert match is not None
     assert isinstance(match.id, str)
-    assert match.mrn == "1001"
-    assert match.name == "Test^2"
-    assert match.birth_date == None
-    assert match.sex == None
+    assert_demographics(match, "1001", "Test^2")
 
     # Verify with search parameter 1
     patients = pk.patients.query(workspace.id, "1001")
@@ -261,8 +269,7 @@ def test_query(app, workspace_generator):
     assert len(patients) == 1
 
     # Verify paging
-    for i in range(12):
-        pk.patients.create(workspace.id, "patient" + str(i), "Patient " + str(i))
+    pk.patients.create_many(workspace.id, [{"mrn": "patient" + str(i), "name": "Patient " + str(i)} for i in range(12)])
 
     query = {'page_size': 5}
     patients = pk.patients._query(workspace, query)
@@ -275,24 +282,18 @@ def test_refresh(app, workspace_generator):
     patient = pk.patients.create(workspace.id, "1000", "Last^First", "2018-01-01", "M")
 
     other = pk.patients.get(workspace.id, patient.id)
-    other.upload("./data/Becker^Matthew")
+    other.upload(BECKER_PATH)
     other.mrn = "1000-AAAA-2000"
     other.name = "Modified^Name"
     other.birth_date = "2019-01-01"
     other.sex = "F"
     other.save()
 
-    assert patient.mrn == "1000"
-    assert patient.name == "Last^First"
-    assert patient.birth_date == "2018-01-01"
-    assert patient.sex == "M"
+    assert_demographics(patient, "1000", "Last^First", "2018-01-01", "M")
     assert len(patient.studies) == 0
 
     patient.refresh()
-    assert patient.mrn == "1000-AAAA-2000"
-    assert patient.name == "Modified^Name"
-    assert patient.birth_date == "2019-01-01"
-    assert patient.sex == "F"
+    assert_demographics(patient, "1000-AAAA-2000", "Modified^Name", "2019-01-01", "F")
     assert len(patient.studies) == 1
 
 def test_update(app, custom_metric_generator, workspace_generator):
@@ -315,19 +316,11 @@ def test_update(app, custom_metric_generator, workspace_generator):
     meta[custom_metric_enum.name] = "one"
     patient.set_metadata(meta)
     patient.save()
-    patients = pk.patients.query(workspace.id)
-    for patient in patients:
-        if patient.mrn == "1000-AAAA-2000":
-            patient_match = patient
-            break
-    else:
-        patient_match = None
+    patients = {patient.mrn: patient for patient in pk.patients.query(workspace.id)}
+    patient_match = patients.get("1000-AAAA-2000")
     assert patient_match is not None
     patient_item = patient_match.get()
-    assert patient_item.mrn == "1000-AAAA-2000"
-    assert patient_item.name == "Modified^Name"
-    assert patient_item.birth_date == "2018-01-01"
-    assert patient_item.sex == "M"
+    assert_demographics(patient_item, "1000-AAAA-2000", "Modified^Name", "2018-01-01", "M")
     assert patient_item.get_metadata() == {
         custom_metric_string.name: "test",
         custom_metric_number.name: 42,
@@ -338,8 +331,10 @@ def test_update_failure(app, workspace_generator):
     pk = app.pk
 
     _, workspace = workspace_generator()
-    patient1 = pk.patients.create(workspace.id, "1000", "Last^First")
-    patient2 = pk.patients.create(workspace.id, "1001", "Last^First")
+    patient1, patient2 = pk.patients.create_many(workspace.id, [
+        {"mrn": "1000", "name": "Last^First"},
+        {"mrn": "1001", "name": "Last^First"},
+    ])
 
     with pytest.raises(Exceptions.HttpError) as err_wrapper:
         patient1.mrn = "1001"
@@ -359,10 +354,8 @@ def test_set_metadata_failure(app, workspace_generator):
         patient.set_metadata(meta)
     assert err_wrapper.value.message == 'Custom metric with name `Unknown Metric` not found.'
 
-def test_find_entities(app, patient_generator):
-    pk = app.pk
-
-    patient = patient_generator("./data/Becker^Matthew")
+def test_find_entities(becker_patient):
+    patient = becker_patient
 
     # Find with no args
     entities = patient.find_entities()
@@ -399,13 +392,24 @@ def test_find_entities(app, patient_generator):
     entities = patient.find_entities(lambda entity: entity.data["type"] == "dose" or entity.data["type"] == "plan")
     assert len(entities) == 2
 
+def test_list_entities(becker_patient):
+    patient = becker_patient
+
+    entities = patient.list_entities()
+    assert len(entities) == 4
+    assert [entity.id for entity in entities] == [entity.id for entity in patient.find_entities(lambda entity: True)]
+
+    # Verify the returned list is a copy
+    entities.pop()
+    assert len(patient.list_entities()) == 4
+
 def test_upload(app, workspace_generator):
     pk = app.pk
 
     _, workspace = workspace_generator()
     patient = pk.patients.create(workspace.id, "1000", "Last^First", "2018-01-01", "M")
 
-    batch = patient.upload("./data/Becker^Matthew")
+    batch = patient.upload(BECKER_PATH)
     assert len(batch.patients) == 1
     uploaded_patient = batch.patients[0]
     assert patient.id == uploaded_patient.id
@@ -415,14 +419,14 @@ def test_upload(app, workspace_generator):
     assert patient.name == uploaded_patient_item.name
     assert patient.birth_date == uploaded_patient_item.birth_date
     assert patient.sex == uploaded_patient_item.sex
-    entities = uploaded_patient_item.find_entities(lambda entity: True)
+    entities = uploaded_patient_item.list_entities()
     assert len(entities) == 4
 
     _, workspace = workspace_generator()
     pk.patients.create(workspace.id, "1000", "Last^First", "2018-01-01", "M")
     patient = pk.patients.lookup(workspace.id, ["1000"])[0]
 
-    batch = patient.upload("./data/Becker^Matthew")
+    batch = patient.upload(BECKER_PATH)
     assert len(batch.patients) == 1
     uploaded_patient = batch.patients[0]
     assert patient.id == uploaded_patient.id
@@ -432,17 +436,15 @@ def test_upload(app, workspace_generator):
     assert patient.name == uploaded_patient_item.name
     assert patient.birth_date == uploaded_patient_item.birth_date
     assert patient.sex == uploaded_patient_item.sex
-    entities = uploaded_patient_item.find_entities(lambda entity: True)
+    entities = uploaded_patient_item.list_entities()
     assert len(entities) == 4
 
-def test_studies(app, patient_generator):
+def test_studies(becker_patient):
     ###
     # This test was written specifically to cover the id and data properties in the
     # `proknow/Patients/Studies.py` file.
     ###
-    pk = app.pk
-
-    patient = patient_generator("./data/Becker^Matthew")
+    patient = becker_patient
     assert len(patient.studies) == 1
     study = patient.studies[0]
     assert isinstance(study.id, str)
@@ -1,46 +1,37 @@
 import pytest
-import filecmp
 import os
 
 from proknow import ProKnow, Exceptions
 
-def test_download(app, entity_generator, temp_directory):
-    pk = app.pk
+BECKER_PATH = os.path.abspath("./data/Becker^Matthew")
+PLAN_PATH = os.path.join(BECKER_PATH, "HNC0522c0009_Plan1.dcm")
 
-    plan_path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_Plan1.dcm")
-    plan = entity_generator(plan_path)
+def test_download(app, readonly_entity_generator, download_checker):
+    plan = readonly_entity_generator(PLAN_PATH)
 
-    # Download to directory
-    download_path = plan.download(temp_directory.path)
-    assert filecmp.cmp(plan_path, download_path, shallow=False)
-
-    # Download to specific file
-    specific_path = os.path.join(temp_directory.path, "plan.dcm")
-    download_path = plan.download(specific_path)
-    assert specific_path == download_path
-    assert filecmp.cmp(plan_path, download_path, shallow=False)
+    download_checker(plan, PLAN_PATH, "plan.dcm")
 
     # File does not exist
     with pytest.raises(Exceptions.InvalidPathError) as err_wrapper:
-        download_path = plan.download("/path/to/nowhere/plan.dcm")
+        plan.download("/path/to/nowhere/plan.dcm")
     assert err_wrapper.value.message == "`/path/to/nowhere/plan.dcm` is invalid"
 
-def test_get_delivery_information(app, entity_generator):
-    pk = app.pk
+    # Not a path or writable file object
+    with pytest.raises(AssertionError) as err_wrapper:
+        plan.download(None)
+    assert str(err_wrapper.value) == "`path` is required as a string or a writable file object."
 
-    plan_path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_Plan1.dcm")
-    plan = entity_generator(plan_path)
+def test_get_delivery_information(app, readonly_entity_generator):
+    plan = readonly_entity_generator(PLAN_PATH)
 
     info = plan.get_delivery_information()
     assert isinstance(info, dict)
 
 def test_refresh(app, patient_generator):
-    pk = app.pk
-
     patient = patient_generator([
-        "./data/Becker^Matthew/HNC0522c0009_CT1_image00000.dcm",
-        "./data/Becker^Matthew/HNC0522c0009_StrctrSets.dcm",
-        "./data/Becker^Matthew/HNC0522c0009_Plan1.dcm"
+        os.path.join(BECKER_PATH, "HNC0522c0009_CT1_image00000.dcm"),
+        os.path.join(BECKER_PATH, "HNC0522c0009_StrctrSets.dcm"),
+        PLAN_PATH
     ])
     plan = patient.find_entities(type="plan")[0].get()
     structure_set = patient.find_entities(type="structure_set")[0]
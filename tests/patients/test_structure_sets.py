@@ -1,64 +1,64 @@
 import pytest
 import re
 import json
-import copy
-import filecmp
 import os
-from time import sleep
 
 from proknow import ProKnow, Exceptions
 
-def test_download(app, entity_generator, temp_directory):
-    pk = app.pk
+BECKER_PATH = os.path.abspath("./data/Becker^Matthew")
+STRUCTURE_SET_PATH = os.path.join(BECKER_PATH, "HNC0522c0009_StrctrSets.dcm")
 
-    structure_set_path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_StrctrSets.dcm")
-    structure_set = entity_generator(structure_set_path)
+def rois_by_name(rois):
+    return {roi.name: roi for roi in rois}
 
-    # Download to directory
-    download_path = structure_set.download(temp_directory.path)
-    assert filecmp.cmp(structure_set_path, download_path, shallow=False)
+@pytest.fixture(scope="module")
+def ptv_data():
+    with open("./data/Becker^Matthew-data/structure_data_PTV.json", 'rb') as file:
+        return json.loads(file.read())
 
-    # Download to specific file
-    specific_path = os.path.join(temp_directory.path, "structure_set.dcm")
-    download_path = structure_set.download(specific_path)
-    assert specific_path == download_path
-    assert filecmp.cmp(structure_set_path, download_path, shallow=False)
+@pytest.fixture(scope="module")
+def versioned_structure_set(app, module_workspace_generator):
+    # Draft, approved, and archived versions for the tests that only read them
+    _, workspace = module_workspace_generator()
+    batch = app.pk.uploads.upload(workspace.id, STRUCTURE_SET_PATH)
+    structure_set = batch.find_entity(STRUCTURE_SET_PATH).get()
+    with structure_set.draft() as draft:
+        structure_set = draft.approve()
+    with structure_set.draft() as draft:
+        pass
+    return structure_set
 
-def test_download_failure(app, entity_generator, temp_directory):
-    pk = app.pk
+def test_download(app, readonly_entity_generator, download_checker):
+    structure_set = readonly_entity_generator(STRUCTURE_SET_PATH)
+
+    download_checker(structure_set, STRUCTURE_SET_PATH, "structure_set.dcm")
 
-    structure_set_path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_StrctrSets.dcm")
-    structure_set = entity_generator(structure_set_path)
+def test_download_failure(app, entity_generator, temp_directory):
+    structure_set = entity_generator(STRUCTURE_SET_PATH)
 
     # File does not exist
     with pytest.raises(Exceptions.InvalidPathError) as err_wrapper:
-        download_path = structure_set.download("/path/to/nowhere/structure_set.dcm")
+        structure_set.download("/path/to/nowhere/structure_set.dcm")
     assert err_wrapper.value.message == "`/path/to/nowhere/structure_set.dcm` is invalid"
 
     # Entity is a draft
     with structure_set.draft() as draft:
         with pytest.raises(Exceptions.InvalidOperationError) as err_wrapper:
-            download_path = draft.download(temp_directory.path)
+            draft.download(temp_directory.path)
         assert err_wrapper.value.message == "Draft versions of structure sets cannot be downloaded"
 
-def test_rois(app, entity_generator):
-    pk = app.pk
-
-    structure_set = entity_generator("./data/Becker^Matthew/HNC0522c0009_StrctrSets.dcm", type="structure_set")
+def test_rois(app, readonly_entity_generator):
+    structure_set = readonly_entity_generator(STRUCTURE_SET_PATH, type="structure_set")
     assert isinstance(structure_set.rois, list)
     structures = [
         ("BODY", "EXTERNAL", [0, 255, 0]),
         ("PAROTID_LT", "ORGAN", [0, 0, 255]),
         ("PTV", "ORGAN", [255, 0, 0])
     ]
+    rois = rois_by_name(structure_set.rois)
     for structure in structures:
         name = structure[0]
-        for roi in structure_set.rois:
-            if roi.name == name:
-                match = roi
-                break
-        else:
-            match = None
+        match = rois.get(name)
         assert match is not None
         assert match.type == structure[1]
         assert match.color == structure[2]
@@ -72,24 +72,15 @@ def test_rois(app, entity_generator):
         match.save()
     assert err_wrapper.value.message == "Item is not editable"
 
-def test_rois_get_data(app, entity_generator):
-    pk = app.pk
-
-    structure_set = entity_generator("./data/Becker^Matthew/HNC0522c0009_StrctrSets.dcm", type="structure_set")
-    for roi in structure_set.rois:
-        if roi.name == "PTV":
-            match = roi
-            break
-    else:
-        match = None
+def test_rois_get_data(app, readonly_entity_generator, ptv_data):
+    structure_set = readonly_entity_generator(STRUCTURE_SET_PATH, type="structure_set")
+    match = rois_by_name(structure_set.rois).get("PTV")
     assert match is not None
     roi_data = match.get_data()
     assert roi_data.is_editable() is False
-    with open("./data/Becker^Matthew-data/structure_data_PTV.json", 'r') as file:
-        data = json.load(file)
-        assert roi_data.contours == data["contours"]
-        assert roi_data.lines == data["lines"]
-        assert roi_data.points == data["points"]
+    assert roi_data.contours == ptv_data["contours"]
+    assert roi_data.lines == ptv_data["lines"]
+    assert roi_data.points == ptv_data["points"]
 
     with pytest.raises(Exceptions.InvalidOperationError) as err_wrapper:
         roi_data.save()
@@ -98,7 +89,7 @@ def test_rois_get_data(app, entity_generator):
 def test_draft(app, entity_generator):
     pk = app.pk
 
-    structure_set = entity_generator("./data/Becker^Matthew/HNC0522c0009_StrctrSets.dcm", type="structure_set")
+    structure_set = entity_generator(STRUCTURE_SET_PATH, type="structure_set")
 
     # With context manager
     with structure_set.draft() as draft:
@@ -127,7 +118,7 @@ def test_draft(app, entity_generator):
     structure_set.stop_renewer()
     assert structure_set._renewer is None
 
-    structure_set = entity_generator("./data/Becker^Matthew/HNC0522c0009_StrctrSets.dcm", type="structure_set")
+    structure_set = entity_generator(STRUCTURE_SET_PATH, type="structure_set")
     pk.patients.delete(structure_set.workspace_id, structure_set.patient_id)
     with pytest.raises(Exceptions.HttpError) as err_wrapper:
         structure_set.draft()
@@ -138,47 +129,27 @@ def test_lock_renewal(app, entity_generator):
     pk = app.pk
     pk.LOCK_RENEWAL_BUFFER = 358
 
-    structure_set = entity_generator("./data/Becker^Matthew/HNC0522c0009_StrctrSets.dcm", type="structure_set")
+    structure_set = entity_generator(STRUCTURE_SET_PATH, type="structure_set")
     with structure_set.draft() as draft:
-        i = 0
         expires_at_initial = draft._lock["expires_at"]
-        while True:
-            if expires_at_initial != draft._lock["expires_at"]:
-                break
-            elif i > 50:
-                raise ValueError('Timeout waiting for lock to renew')
-            else:
-                sleep(0.1)
-            i += 1
+        assert draft._renewer.renewed.wait(timeout=5.0), 'Timeout waiting for lock to renew'
         assert expires_at_initial != draft._lock["expires_at"]
 
     pk.LOCK_RENEWAL_BUFFER = 30
 
 def test_draft_edit(app, entity_generator):
-    pk = app.pk
-
-    structure_set = entity_generator("./data/Becker^Matthew", type="structure_set")
+    structure_set = entity_generator(BECKER_PATH, type="structure_set")
     with structure_set.draft() as draft:
         assert len(draft.rois) == 3
 
         # Discard the PAROTID_LT structure
-        for roi in draft.rois:
-            if roi.name == "PAROTID_LT":
-                match = roi
-                break
-        else:
-            match = None
+        match = rois_by_name(draft.rois).get("PAROTID_LT")
         assert match is not None
         match.delete()
         assert len(draft.rois) == 2
 
         # Edit the name, color, and type of PTV structure
-        for roi in draft.rois:
-            if roi.name == "PTV":
-                match = roi
-                break
-        else:
-            match = None
+        match = rois_by_name(draft.rois).get("PTV")
         assert match is not None
         match.name = "PTV2"
         match.color = [255, 147, 0]
@@ -189,34 +160,20 @@ def test_draft_edit(app, entity_generator):
         item = draft.create_roi('PATIENT', [0, 238, 255], 'EXTERNAL')
         assert len(draft.rois) == 3
         data = item.get_data()
-        for roi in draft.rois:
-            if roi.name == "BODY":
-                match = roi
-                break
-        else:
-            match = None
-        data.contours = copy.deepcopy(match.get_data().contours)
+        match = rois_by_name(draft.rois).get("BODY")
+        data.contours = match.get_data().contours
         data.save()
 
         # Modify existing contour data
-        for roi in draft.rois:
-            if roi.name == "BODY":
-                match = roi
-                break
-        else:
-            match = None
+        match = rois_by_name(draft.rois).get("BODY")
         data = match.get_data()
         contours = data.contours
         modified = []
         for contour in contours:
             modified_contours = { 'pos': contour["pos"], 'paths': [] }
             for path in contour["paths"]:
-                modified_path = []
-                i = 0
-                length = len(path)
-                while i < length:
-                    modified_path.extend([path[i], path[i+1]])
-                    i += 4 # skip every other pair
+                # Keep every other (x, y) pair
+                modified_path = [value for pair in zip(path[0::4], path[1::4]) for value in pair]
                 modified_contours["paths"].append(modified_path)
             modified.append(modified_contours)
         contours = modified
@@ -232,85 +189,53 @@ def test_draft_edit(app, entity_generator):
         ("PTV2", "PTV", [255, 147, 0]),
         ("PATIENT", "EXTERNAL", [0, 238, 255])
     ]
+    rois = rois_by_name(structure_set.rois)
     for structure in structures:
         name = structure[0]
-        for roi in structure_set.rois:
-            if roi.name == name:
-                match = roi
-                break
-        else:
-            match = None
+        match = rois.get(name)
         assert match is not None
         assert match.type == structure[1]
         assert match.color == structure[2]
         assert match.is_editable() is False
 
 def test_discard(app, entity_generator):
-    pk = app.pk
-
-    structure_set = entity_generator("./data/Becker^Matthew/HNC0522c0009_StrctrSets.dcm", type="structure_set")
+    structure_set = entity_generator(STRUCTURE_SET_PATH, type="structure_set")
     with structure_set.draft() as draft:
         draft.discard()
     assert len(structure_set.versions.query()) == 1
 
-def test_approve_failure(app, entity_generator):
-    pk = app.pk
-
-    structure_set_path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_StrctrSets.dcm")
-    structure_set = entity_generator(structure_set_path)
+def test_approve_failure(app, readonly_entity_generator):
+    structure_set = readonly_entity_generator(STRUCTURE_SET_PATH)
     with pytest.raises(Exceptions.InvalidOperationError) as err_wrapper:
         structure_set.approve()
     assert err_wrapper.value.message == "Item is not editable"
 
-def test_create_roi_failure(app, entity_generator):
-    pk = app.pk
-
-    structure_set_path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_StrctrSets.dcm")
-    structure_set = entity_generator(structure_set_path)
+def test_create_roi_failure(app, readonly_entity_generator):
+    structure_set = readonly_entity_generator(STRUCTURE_SET_PATH)
     with pytest.raises(Exceptions.InvalidOperationError) as err_wrapper:
         structure_set.create_roi("test", [123, 0, 123], "ORGAN")
     assert err_wrapper.value.message == "Item is not editable"
 
-def test_discard_failure(app, entity_generator):
-    pk = app.pk
-
-    structure_set_path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_StrctrSets.dcm")
-    structure_set = entity_generator(structure_set_path)
+def test_discard_failure(app, readonly_entity_generator):
+    structure_set = readonly_entity_generator(STRUCTURE_SET_PATH)
     with pytest.raises(Exceptions.InvalidOperationError) as err_wrapper:
         structure_set.discard()
     assert err_wrapper.value.message == "Item is not editable"
 
-def test_versions_query(app, entity_generator):
-    pk = app.pk
-
-    structure_set = entity_generator("./data/Becker^Matthew/HNC0522c0009_StrctrSets.dcm", type="structure_set")
-    with structure_set.draft() as draft:
-        structure_set = draft.approve()
-    with structure_set.draft() as draft:
-        pass
-
+def test_versions_query(app, versioned_structure_set):
+    structure_set = versioned_structure_set
     versions = structure_set.versions.query()
     assert len(versions) == 3
     assert versions[0].status == "draft"
     assert versions[1].status == "approved"
     assert versions[2].status == "archived"
 
-def test_version_download(app, entity_generator, temp_directory):
-    pk = app.pk
-
-    structure_set_path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_StrctrSets.dcm")
-    structure_set = entity_generator("./data/Becker^Matthew", type="structure_set")
+def test_version_download(app, entity_generator, temp_directory, download_checker):
+    structure_set = entity_generator(BECKER_PATH, type="structure_set")
     version = structure_set.versions.query()[0]
 
-    # Download to directory
-    download_path = version.download(temp_directory.path)
-    assert filecmp.cmp(structure_set_path, download_path, shallow=False)
-
-    # Download to specific file
-    specific_path = os.path.join(temp_directory.path, "structure_set.dcm")
-    download_path = version.download(specific_path)
-    assert specific_path == download_path
-    assert filecmp.cmp(structure_set_path, download_path, shallow=False)
+    # Download to directory, specific file, and file object
+    download_checker(version, STRUCTURE_SET_PATH, "structure_set.dcm")
 
     # File does not exist
     with pytest.raises(Exceptions.InvalidPathError) as err_wrapper:
@@ -332,7 +257,7 @@ def test_version_download(app, entity_generator, temp_directory):
         structure_set = draft.approve()
 
     # Verify download completes
-    download_path = structure_set.versions.query()[0].download(temp_directory.path)
+    structure_set.versions.query()[0].download(temp_directory.path)
 
     # Approve draft with no rois
     with structure_set.draft() as draft:
@@ -343,14 +268,12 @@ def test_version_download(app, entity_generator, temp_directory):
 
     # Verify download error
     with pytest.raises(Exceptions.HttpError) as err_wrapper:
-        download_path = structure_set.versions.query()[0].download(temp_directory.path)
+        structure_set.versions.query()[0].download(temp_directory.path)
     assert err_wrapper.value.status_code == 400
     assert err_wrapper.value.body == 'Structure set is empty.'
 
 def test_version_delete(app, entity_generator):
-    pk = app.pk
-
-    structure_set = entity_generator("./data/Becker^Matthew/HNC0522c0009_StrctrSets.dcm", type="structure_set")
+    structure_set = entity_generator(STRUCTURE_SET_PATH, type="structure_set")
     with structure_set.draft() as draft:
         structure_set = draft.approve()
     with structure_set.draft() as draft:
@@ -365,15 +288,8 @@ def test_version_delete(app, entity_generator):
         draft_version.delete()
     assert err_wrapper.value.message == "Draft versions of structure sets cannot be deleted"
 
-def test_version_get(app, entity_generator):
-    pk = app.pk
-
-    structure_set = entity_generator("./data/Becker^Matthew/HNC0522c0009_StrctrSets.dcm", type="structure_set")
-    with structure_set.draft() as draft:
-        structure_set = draft.approve()
-    with structure_set.draft() as draft:
-        pass
-
+def test_version_get(app, versioned_structure_set):
+    structure_set = versioned_structure_set
     versions = structure_set.versions.query()
     assert len(versions) == 3
     draft_version = versions[0].get()
@@ -390,9 +306,7 @@ def test_version_get(app, entity_generator):
     assert archived_version.rois is not None
 
 def test_version_revert(app, entity_generator):
-    pk = app.pk
-
-    structure_set = entity_generator("./data/Becker^Matthew/HNC0522c0009_StrctrSets.dcm", type="structure_set")
+    structure_set = entity_generator(STRUCTURE_SET_PATH, type="structure_set")
     with structure_set.draft() as draft:
         structure_set = draft.approve()
     with structure_set.draft() as draft:
@@ -419,9 +333,7 @@ def test_version_revert(app, entity_generator):
     assert versions[2].status == 'archived'
 
 def test_version_save(app, entity_generator):
-    pk = app.pk
-
-    structure_set = entity_generator("./data/Becker^Matthew/HNC0522c0009_StrctrSets.dcm", type="structure_set")
+    structure_set = entity_generator(STRUCTURE_SET_PATH, type="structure_set")
     with structure_set.draft() as draft:
         structure_set = draft.approve()
     with structure_set.draft() as draft:
@@ -468,8 +380,8 @@ def test_refresh(app, workspace_generator):
 
     patient.upload([
         "./data/Jensen^Myrtle/HNC0522c0013_CT1_image00000.dcm",
-        "./data/Becker^Matthew/HNC0522c0009_CT1_image00000.dcm",
-        "./data/Becker^Matthew/HNC0522c0009_StrctrSets.dcm",
+        os.path.join(BECKER_PATH, "HNC0522c0009_CT1_image00000.dcm"),
+        STRUCTURE_SET_PATH,
     ])
     patient.refresh()
     structure_set = patient.find_entities(type="structure_set")[0].get()
@@ -4,12 +4,24 @@ import os
 
 from proknow import Exceptions
 
+BECKER_PATH = os.path.abspath("./data/Becker^Matthew")
+IMAGE_PATH = os.path.join(BECKER_PATH, "HNC0522c0009_CT1_image00000.dcm")
+STRUCTURE_SET_PATH = os.path.join(BECKER_PATH, "HNC0522c0009_StrctrSets.dcm")
+PLAN_PATH = os.path.join(BECKER_PATH, "HNC0522c0009_Plan1.dcm")
+DOSE_PATH = os.path.join(BECKER_PATH, "HNC0522c0009_Plan1_Dose.dcm")
+
+@pytest.fixture(scope="module")
+def becker_batch(app, module_workspace_generator):
+    # One upload of the Becker^Matthew directory shared by the tests that only read the batch
+    _, workspace = module_workspace_generator()
+    return app.pk.uploads.upload(workspace.id, BECKER_PATH)
+
 def test_upload(app, workspace_generator):
     pk = app.pk
 
     _, workspace = workspace_generator()
 
-    batch = pk.uploads.upload(workspace.id, "./data/Becker^Matthew")
+    batch = pk.uploads.upload(workspace.id, BECKER_PATH)
     assert len(batch.patients) == 1
     for patient_summary in batch.patients:
         assert len(patient_summary.entities) == 4
@@ -24,86 +36,52 @@ def test_upload_failure(app, workspace_generator):
     assert err_wrapper.value.message == "`./path/to/nowhere` is invalid."
 
     with pytest.raises(Exceptions.WorkspaceLookupError) as err_wrapper:
-        pk.uploads.upload("Not a Workspace", "./data/Becker^Matthew")
+        pk.uploads.upload("Not a Workspace", BECKER_PATH)
     assert err_wrapper.value.message == "Workspace with name `Not a Workspace` not found."
 
-def test_upload_batch_find_patient(app, workspace_generator):
-    pk = app.pk
-
-    _, workspace = workspace_generator()
-
-    path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_Plan1.dcm")
-    batch = pk.uploads.upload(workspace.id, path)
-    patient = batch.find_patient(path)
+def test_upload_batch_find_patient(becker_batch):
+    batch = becker_batch
+    patient = batch.find_patient(PLAN_PATH)
     assert patient == batch.patients[0]
 
-def test_upload_batch_file_patient_failure(app, workspace_generator):
-    pk = app.pk
-
-    _, workspace = workspace_generator()
-
-    path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_Plan1.dcm")
-    batch = pk.uploads.upload(workspace.id, path)
+def test_upload_batch_file_patient_failure(becker_batch):
+    batch = becker_batch
     with pytest.raises(Exceptions.InvalidPathError) as err_wrapper:
-        patient = batch.find_patient(path + "m")
-    assert err_wrapper.value.message == '`' + path + 'm` not found in current batch'
-
-def test_upload_batch_find_entity(app, workspace_generator):
-    pk = app.pk
-
-    _, workspace = workspace_generator()
-
-    image_set_path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_CT1_image00000.dcm")
-    structure_set_path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_StrctrSets.dcm")
-    plan_path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_Plan1.dcm")
-    dose_path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_Plan1_Dose.dcm")
-
-    batch = pk.uploads.upload(workspace.id, "./data/Becker^Matthew")
+        patient = batch.find_patient(PLAN_PATH + "m")
+    assert err_wrapper.value.message == '`' + PLAN_PATH + 'm` not found in current batch'
+
+def test_upload_batch_find_entity(becker_batch):
+    paths = {
+        "image_set": IMAGE_PATH,
+        "structure_set": STRUCTURE_SET_PATH,
+        "plan": PLAN_PATH,
+        "dose": DOSE_PATH,
+    }
+
+    batch = becker_batch
     entities = batch.patients[0].entities
     assert len(entities) == 4
     for entity in entities:
-        if entity.data["type"] == "image_set":
-            assert entity == batch.find_entity(image_set_path)
-        elif entity.data["type"] == "structure_set":
-            assert entity == batch.find_entity(structure_set_path)
-        elif entity.data["type"] == "plan":
-            assert entity == batch.find_entity(plan_path)
-        elif entity.data["type"] == "dose":
-            assert entity == batch.find_entity(dose_path)
-        else:
-            raise ValueError("Unexpected type: " + entity.data["type"])
-
-def test_upload_batch_find_entity_failure(app, workspace_generator):
-    pk = app.pk
+        entity_type = entity.data["type"]
+        assert entity_type in paths, "Unexpected type: " + entity_type
+        assert entity == batch.find_entity(paths[entity_type])
 
-    _, workspace = workspace_generator()
-
-    path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_Plan1.dcm")
-    batch = pk.uploads.upload(workspace.id, path)
+def test_upload_batch_find_entity_failure(becker_batch):
+    batch = becker_batch
     with pytest.raises(Exceptions.InvalidPathError) as err_wrapper:
-        entity = batch.find_entity(path + "m")
-    assert err_wrapper.value.message == '`' + path + 'm` not found in current batch'
-
-def test_upload_patient_summary_get(app, workspace_generator):
-    pk = app.pk
+        entity = batch.find_entity(PLAN_PATH + "m")
+    assert err_wrapper.value.message == '`' + PLAN_PATH + 'm` not found in current batch'
 
-    _, workspace = workspace_generator()
-
-    path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_Plan1.dcm")
-    batch = pk.uploads.upload(workspace.id, path)
-    patient_summary = batch.find_patient(path)
+def test_upload_patient_summary_get(becker_batch):
+    batch = becker_batch
+    patient_summary = batch.find_patient(PLAN_PATH)
     patient_item = patient_summary.get()
     assert patient_item is not None
     assert isinstance(patient_item.data, dict)
 
-def test_upload_entity_summary_get(app, workspace_generator):
-    pk = app.pk
-
-    _, workspace = workspace_generator()
-
-    path = os.path.abspath("./data/Becker^Matthew/HNC0522c0009_Plan1.dcm")
-    batch = pk.uploads.upload(workspace.id, path)
-    entity_summary = batch.find_entity(path)
+def test_upload_entity_summary_get(becker_batch):
+    batch = becker_batch
+    entity_summary = batch.find_entity(PLAN_PATH)
     entity_item = entity_summary.get()
     assert entity_item is not None
     assert isinstance(entity_item.data, dict)
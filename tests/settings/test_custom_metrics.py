@@ -3,27 +3,23 @@ import re
 
 from proknow import Exceptions
 
+FIND_EXPR = re.compile(r"ind M")
+
+def assert_matches(custom_metric, params):
+    assert (custom_metric.name, custom_metric.context, custom_metric.type) == (params["name"], params["context"], params["type"])
+
 def test_create(app, custom_metric_generator):
     pk = app.pk
 
     # Verify returned CustomMetricItem
     params, custom_metric = custom_metric_generator()
-    assert custom_metric.name == params["name"]
-    assert custom_metric.context == params["context"]
-    assert custom_metric.type == params["type"]
+    assert_matches(custom_metric, params)
 
     # Assert item can be found in query
-    custom_metrics = pk.custom_metrics.query()
-    for custom_metric in custom_metrics:
-        if custom_metric.name == params["name"]:
-            custom_metric_match = custom_metric
-            break
-    else:
-        custom_metric_match = None
+    custom_metrics = {custom_metric.name: custom_metric for custom_metric in pk.custom_metrics.query()}
+    custom_metric_match = custom_metrics.get(params["name"])
     assert custom_metric_match is not None
-    assert custom_metric_match.name == params["name"]
-    assert custom_metric_match.context == params["context"]
-    assert custom_metric_match.type == params["type"]
+    assert_matches(custom_metric_match, params)
 
 def test_create_failure(app, custom_metric_generator):
     pk = app.pk
@@ -43,12 +39,8 @@ def test_delete(app, custom_metric_generator):
 
     # Verify custom metric was deleted successfully
     custom_metric.delete()
-    for custom_metric in pk.custom_metrics.query():
-        if custom_metric.name == params["name"]:
-            match = custom_metric
-            break
-    else:
-        match = None
+    custom_metrics = {custom_metric.name: custom_metric for custom_metric in pk.custom_metrics.query()}
+    match = custom_metrics.get(params["name"])
     assert match is None
 
 def test_delete_failure(app, custom_metric_generator):
@@ -67,35 +59,28 @@ def test_find(app, custom_metric_generator):
     pk = app.pk
 
     params, custom_metric = custom_metric_generator(name="Find Me")
-    expr = re.compile(r"ind M")
 
     # Find with no args
     found = pk.custom_metrics.find()
     assert found is None
 
     # Find using predicate
-    found = pk.custom_metrics.find(lambda ws: expr.search(ws.data["name"]) is not None)
+    found = pk.custom_metrics.find(lambda ws: FIND_EXPR.search(ws.data["name"]) is not None)
     assert found is not None
-    assert found.name == params["name"]
-    assert found.context == params["context"]
-    assert found.type == params["type"]
+    assert_matches(found, params)
 
     # Find using props
     found = pk.custom_metrics.find(id=custom_metric.id, name=params["name"])
     assert found is not None
-    assert found.name == params["name"]
-    assert found.context == params["context"]
-    assert found.type == params["type"]
+    assert_matches(found, params)
 
     # Find using both
-    found = pk.custom_metrics.find(lambda ws: expr.search(ws.data["name"]) is not None, id=custom_metric.id, name=params["name"])
+    found = pk.custom_metrics.find(lambda ws: FIND_EXPR.search(ws.data["name"]) is not None, id=custom_metric.id, name=params["name"])
     assert found is not None
-    assert found.name == params["name"]
-    assert found.context == params["context"]
-    assert found.type == params["type"]
+    assert_matches(found, params)
 
     # Find failure
-    found = pk.custom_metrics.find(lambda ws: expr.search(ws.data["id"]) is not None)
+    found = pk.custom_metrics.find(lambda ws: FIND_EXPR.search(ws.data["id"]) is not None)
     assert found is None
     found = pk.custom_metrics.find(id=custom_metric.id, name=params["name"].lower())
     assert found is None
@@ -103,32 +88,39 @@ def test_find(app, custom_metric_generator):
 def test_query(app, custom_metric_generator):
     pk = app.pk
 
-    params1, custom_metric1 = custom_metric_generator()
-    params2, custom_metric2 = custom_metric_generator()
+    (params1, custom_metric1), (params2, custom_metric2) = custom_metric_generator(n=2)
+
+    custom_metrics = {custom_metric.name: custom_metric for custom_metric in pk.custom_metrics.query()}
 
     # Verify test 1
-    for custom_metric in pk.custom_metrics.query():
-        if custom_metric.name == params1["name"]:
-            match = custom_metric
-            break
-    else:
-        match = None
+    match = custom_metrics.get(params1["name"])
     assert match is not None
-    assert match.name == params1["name"]
-    assert match.context == params1["context"]
-    assert match.type == params1["type"]
+    assert_matches(match, params1)
 
     # Verify test 2
-    for custom_metric in pk.custom_metrics.query():
-        if custom_metric.name == params2["name"]:
-            match = custom_metric
-            break
-    else:
-        match = None
+    match = custom_metrics.get(params2["name"])
     assert match is not None
-    assert match.name == params2["name"]
-    assert match.context == params2["context"]
-    assert match.type == params2["type"]
+    assert_matches(match, params2)
+
+def test_query_revalidates(app, custom_metric_generator, response_recorder):
+    pk = app.pk
+
+    custom_metric_generator()
+
+    # Verify the second query sends the ETag stored by the first and returns the same list
+    custom_metrics = pk.custom_metrics.query()
+    custom_metrics[0].data["name"] = "Edited Locally"
+    requeried = pk.custom_metrics.query()
+    first, second = response_recorder[-2:]
+    if first.status_code == 304:
+        etag = first.request.headers.get("If-None-Match")
+    else:
+        etag = first.headers.get("ETag")
+    assert second.request.headers.get("If-None-Match") == etag
+    assert [custom_metric.id for custom_metric in requeried] == [custom_metric.id for custom_metric in custom_metrics]
+
+    # Verify a local edit to the first result does not leak into the second
+    assert requeried[0].data["name"] != "Edited Locally"
 
 def test_resolve(app, custom_metric_generator):
     pk = app.pk
@@ -138,16 +130,12 @@ def test_resolve(app, custom_metric_generator):
     # Test resolve by id
     resolved = pk.custom_metrics.resolve(custom_metric.id)
     assert resolved is not None
-    assert resolved.name == params["name"]
-    assert resolved.context == params["context"]
-    assert resolved.type == params["type"]
+    assert_matches(resolved, params)
 
     # Test resolve by name
     resolved = pk.custom_metrics.resolve(params["name"])
     assert resolved is not None
-    assert resolved.name == params["name"]
-    assert resolved.context == params["context"]
-    assert resolved.type == params["type"]
+    assert_matches(resolved, params)
 
 def test_resolve_failure(app):
     pk = app.pk
@@ -169,9 +157,7 @@ def test_resolve_by_id(app, custom_metric_generator):
 
     resolved = pk.custom_metrics.resolve_by_id(custom_metric.id)
     assert resolved is not None
-    assert resolved.name == params["name"]
-    assert resolved.context == params["context"]
-    assert resolved.type == params["type"]
+    assert_matches(resolved, params)
 
 def test_resolve_by_id_failure(app):
     pk = app.pk
@@ -187,15 +173,11 @@ def test_resolve_by_name(app, custom_metric_generator):
 
     resolved = pk.custom_metrics.resolve_by_name(params["name"])
     assert resolved is not None
-    assert resolved.name == params["name"]
-    assert resolved.context == params["context"]
-    assert resolved.type == params["type"]
+    assert_matches(resolved, params)
 
     resolved = pk.custom_metrics.resolve_by_name(params["name"].upper())
     assert resolved is not None
-    assert resolved.name == params["name"]
-    assert resolved.context == params["context"]
-    assert resolved.type == params["type"]
+    assert_matches(resolved, params)
 
 def test_resolve_by_name_failure(app):
     pk = app.pk
@@ -215,18 +197,40 @@ def test_update(app, custom_metric_generator):
     custom_metric.name = updated_name
     custom_metric.context = "image_set"
     custom_metric.save()
-    custom_metrics = pk.custom_metrics.query()
-    for custom_metric in custom_metrics:
-        if custom_metric.name == updated_name:
-            custom_metric_match = custom_metric
-            break
-    else:
-        custom_metric_match = None
+    custom_metrics = {custom_metric.name: custom_metric for custom_metric in pk.custom_metrics.query()}
+    custom_metric_match = custom_metrics.get(updated_name)
     assert custom_metric_match is not None
     assert custom_metric_match.name == updated_name
     assert custom_metric_match.context == "image_set"
     assert custom_metric_match.type == params["type"]
 
+def test_update_unchanged(app, custom_metric_generator, response_recorder):
+    pk = app.pk
+
+    params, custom_metric = custom_metric_generator()
+
+    # Verify saving a custom metric without changes sends no request
+    del response_recorder[:]
+    custom_metric.save()
+    assert response_recorder == []
+    custom_metrics = {custom_metric.name: custom_metric for custom_metric in pk.custom_metrics.query()}
+    custom_metric_match = custom_metrics.get(params["name"])
+    assert custom_metric_match is not None
+    assert custom_metric_match.context == params["context"]
+
+def test_update_deleted(app, custom_metric_generator):
+    params, custom_metric = custom_metric_generator(do_not_mark=True)
+    custom_metric.delete()
+
+    # Verify an unchanged save of a deleted custom metric is skipped without an error
+    custom_metric.save()
+
+    # Verify a changed save of a deleted custom metric still reaches the server and fails
+    with pytest.raises(Exceptions.HttpError) as err_wrapper:
+        custom_metric.context = "image_set"
+        custom_metric.save()
+    assert err_wrapper.value.status_code == 404
+
 def test_update_failure(app, custom_metric_generator):
     pk = app.pk
 
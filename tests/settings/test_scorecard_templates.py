@@ -3,7 +3,9 @@ import re
 
 from proknow import Exceptions
 
-def test_create(app, custom_metric_generator, scorecard_template_generator):
+FIND_EXPR = re.compile(r"ind M")
+
+def test_create(app, custom_metric_generator, scorecard_template_generator, make_computed):
     pk = app.pk
 
     _, custom_metric = custom_metric_generator()
@@ -16,50 +18,11 @@ def test_create(app, custom_metric_generator, scorecard_template_generator):
     assert isinstance(scorecard_template.data, dict)
 
     # Assert item can be found in query
-    scorecard_templates = pk.scorecard_templates.query()
-    for scorecard_template in scorecard_templates:
-        if scorecard_template.name == params["name"]:
-            scorecard_template_match = scorecard_template
-            break
-    else:
-        scorecard_template_match = None
+    scorecard_templates = {scorecard_template.name: scorecard_template for scorecard_template in pk.scorecard_templates.query()}
+    scorecard_template_match = scorecard_templates.get(params["name"])
     assert scorecard_template_match is not None
 
-    computed = [{
-        "type": "VOLUME",
-        "roi_name": "BRAINSTEM",
-        "arg_1": None,
-        "arg_2": None,
-        'rx': None,
-        'rx_scale': None
-    }, {
-        "type": "VOLUME_CC_DOSE_RANGE_ROI",
-        "roi_name": "BRAINSTEM",
-        "arg_1": 30,
-        "arg_2": 60,
-        'rx': None,
-        'rx_scale': None,
-        "objectives": [{
-            "label": "IDEAL",
-            "color": [18, 191, 0],
-            "max": 0
-        }, {
-            "label": "GOOD",
-            "color": [136, 223, 127],
-            "max": 3
-        }, {
-            "label": "ACCEPTABLE",
-            "color": [255, 216, 0],
-            "max": 6
-        }, {
-            "label": "MARGINAL",
-            "color": [255, 102, 0],
-            "max": 9
-        }, {
-            "label": "UNACCEPTABLE",
-            "color": [255, 0, 0]
-        }]
-    }]
+    computed = make_computed(rx=True)
     custom = [{
         "id": custom_metric.id
     }]
@@ -85,12 +48,8 @@ def test_delete(app, scorecard_template_generator):
 
     # Verify scorecard template was deleted successfully
     scorecard_template.delete()
-    for scorecard_template in pk.scorecard_templates.query():
-        if scorecard_template.name == params["name"]:
-            match = scorecard_template
-            break
-    else:
-        match = None
+    scorecard_templates = {scorecard_template.name: scorecard_template for scorecard_template in pk.scorecard_templates.query()}
+    match = scorecard_templates.get(params["name"])
     assert match is None
 
 def test_delete_failure(app, scorecard_template_generator):
@@ -109,14 +68,13 @@ def test_find(app, scorecard_template_generator):
     pk = app.pk
 
     params, scorecard_template = scorecard_template_generator(name="Find Me")
-    expr = re.compile(r"ind M")
 
     # Find with no args
     found = pk.scorecard_templates.find()
     assert found is None
 
     # Find using predicate
-    found = pk.scorecard_templates.find(lambda ws: expr.search(ws.data["name"]) is not None)
+    found = pk.scorecard_templates.find(lambda ws: FIND_EXPR.search(ws.data["name"]) is not None)
     assert found is not None
 
     # Find using props
@@ -124,11 +82,11 @@ def test_find(app, scorecard_template_generator):
     assert found is not None
 
     # Find using both
-    found = pk.scorecard_templates.find(lambda ws: expr.search(ws.data["name"]) is not None, id=scorecard_template.id, name=params["name"])
+    found = pk.scorecard_templates.find(lambda ws: FIND_EXPR.search(ws.data["name"]) is not None, id=scorecard_template.id, name=params["name"])
     assert found is not None
 
     # Find failure
-    found = pk.scorecard_templates.find(lambda ws: expr.search(ws.data["id"]) is not None)
+    found = pk.scorecard_templates.find(lambda ws: FIND_EXPR.search(ws.data["id"]) is not None)
     assert found is None
     found = pk.scorecard_templates.find(id=scorecard_template.id, name=params["name"].lower())
     assert found is None
@@ -136,31 +94,42 @@ def test_find(app, scorecard_template_generator):
 def test_query(app, scorecard_template_generator):
     pk = app.pk
 
-    params1, scorecard_template1 = scorecard_template_generator()
-    params2, scorecard_template2 = scorecard_template_generator()
+    (params1, scorecard_template1), (params2, scorecard_template2) = scorecard_template_generator(n=2)
+
+    scorecard_templates = {scorecard_template.name: scorecard_template for scorecard_template in pk.scorecard_templates.query()}
 
     # Verify test 1
-    for scorecard_template in pk.scorecard_templates.query():
-        if scorecard_template.name == params1["name"]:
-            match = scorecard_template
-            break
-    else:
-        match = None
+    match = scorecard_templates.get(params1["name"])
     assert match is not None
     assert isinstance(match.id, str)
     assert match.name == params1["name"]
 
     # Verify test 2
-    for scorecard_template in pk.scorecard_templates.query():
-        if scorecard_template.name == params2["name"]:
-            match = scorecard_template
-            break
-    else:
-        match = None
+    match = scorecard_templates.get(params2["name"])
     assert match is not None
     assert isinstance(match.id, str)
     assert match.name == params2["name"]
 
+def test_query_revalidates(app, scorecard_template_generator, response_recorder):
+    pk = app.pk
+
+    scorecard_template_generator()
+
+    # Verify the second query sends the ETag stored by the first and returns the same list
+    scorecard_templates = pk.scorecard_templates.query()
+    scorecard_templates[0].data["name"] = "Edited Locally"
+    requeried = pk.scorecard_templates.query()
+    first, second = response_recorder[-2:]
+    if first.status_code == 304:
+        etag = first.request.headers.get("If-None-Match")
+    else:
+        etag = first.headers.get("ETag")
+    assert second.request.headers.get("If-None-Match") == etag
+    assert [scorecard_template.id for scorecard_template in requeried] == [scorecard_template.id for scorecard_template in scorecard_templates]
+
+    # Verify a local edit to the first result does not leak into the second
+    assert requeried[0].data["name"] != "Edited Locally"
+
 def test_resolve(app, scorecard_template_generator):
     pk = app.pk
 
@@ -225,7 +194,7 @@ def test_resolve_by_name_failure(app):
         pk.scorecard_templates.resolve("My Scorecard")
     assert err_wrapper.value.message == "Scorecard template with name `My Scorecard` not found."
 
-def test_update(app, custom_metric_generator, scorecard_template_generator):
+def test_update(app, custom_metric_generator, scorecard_template_generator, make_computed):
     pk = app.pk
 
     _, custom_metric = custom_metric_generator()
@@ -233,48 +202,13 @@ def test_update(app, custom_metric_generator, scorecard_template_generator):
 
     # Verify patient scorecard was updated successfully
     scorecard.name = "My Scorecard Updated"
-    scorecard.computed = [{
-        "type": "VOLUME",
-        "roi_name": "BRAINSTEM",
-        "arg_1": None,
-        "arg_2": None
-    }, {
-        "type": "VOLUME_CC_DOSE_RANGE_ROI",
-        "roi_name": "BRAINSTEM",
-        "arg_1": 30,
-        "arg_2": 60,
-        "objectives": [{
-            "label": "IDEAL",
-            "color": [18, 191, 0],
-            "max": 0
-        }, {
-            "label": "GOOD",
-            "color": [136, 223, 127],
-            "max": 3
-        }, {
-            "label": "ACCEPTABLE",
-            "color": [255, 216, 0],
-            "max": 6
-        }, {
-            "label": "MARGINAL",
-            "color": [255, 102, 0],
-            "max": 9
-        }, {
-            "label": "UNACCEPTABLE",
-            "color": [255, 0, 0]
-        }]
-    }]
+    scorecard.computed = make_computed()
     scorecard.custom = [{
         "id": custom_metric.id
     }]
     scorecard.save()
-    scorecards = pk.scorecard_templates.query()
-    for scorecard in scorecards:
-        if scorecard.name == "My Scorecard Updated":
-            scorecard_match = scorecard
-            break
-    else:
-        scorecard_match = None
+    scorecards = {scorecard.name: scorecard for scorecard in pk.scorecard_templates.query()}
+    scorecard_match = scorecards.get("My Scorecard Updated")
     assert scorecard_match is not None
     scorecard_item = scorecard_match.get()
     assert scorecard_item.name == "My Scorecard Updated"